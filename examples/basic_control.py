@@ -10,11 +10,18 @@ This script demonstrates how to:
 Note: Actions use percentage format (-100 to +100) which maps to the full range
 of each joint. This matches LeRobot's convention of using motor-native units.
 """
+import sys
 import time
 
 from lerobot_robot_roarm import RoarmConfig, Roarm
 
 
+def print_joint_state(state):
+    """Print all joint positions with a single write to stdout."""
+    lines = [f"{name}.pos: {pos:.2f}%" for name, pos in zip(state.joint_names, state.joint_pos)]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def main():
     # Configuration
     # Option 1: Serial connection
@@ -34,6 +41,21 @@ def main():
     print("Initializing Roarm robot...")
     robot = Roarm(config)
     
+    # Fixed actions, built once up front
+    # Values are percentages: -100 (min) to +100 (max) for each joint
+    home_action = {
+        "shoulder_pan.pos": 0.0,     # Center
+        "shoulder_lift.pos": 0.0,    # Center
+        "elbow_flex.pos": 38.5,      # ~180° (upper part of range)
+        "wrist_flex.pos": 0.0,       # Center
+        "wrist_roll.pos": 0.0,       # Center
+        "gripper.pos": 0.0,          # Center
+    }
+    open_gripper_action = {**home_action, "gripper.pos": 50.0}    # Open position
+    close_gripper_action = {**home_action, "gripper.pos": -50.0}  # Closed position
+    joint_names = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+    sweep_action = {f"{joint_name}.pos": 30.0 for joint_name in joint_names}  # All to +30%
+    
     try:
         # Connect to robot
         print("Connecting to robot...")
@@ -44,59 +66,38 @@ def main():
         
         # Read current observation
         print("\n=== Current State ===")
-        obs = robot.get_observation()
-        for key, value in obs.items():
-            if ".pos" in key and "cam" not in key:
-                print(f"{key}: {value:.2f}%")
+        state = robot.get_state()
+        print_joint_state(state)
         
         # Move to home position (center position = 0%)
-        # Values are percentages: -100 (min) to +100 (max) for each joint
         print("\n=== Moving to Home ===")
-        home_action = {
-            "shoulder_pan.pos": 0.0,     # Center
-            "shoulder_lift.pos": 0.0,    # Center
-            "elbow_flex.pos": 38.5,      # ~180° (upper part of range)
-            "wrist_flex.pos": 0.0,       # Center
-            "wrist_roll.pos": 0.0,       # Center
-            "gripper.pos": 0.0,          # Center
-        }
         robot.send_action(home_action)
         time.sleep(3.0)
         
         # Open gripper
         print("\n=== Opening Gripper ===")
-        open_gripper_action = home_action.copy()
-        open_gripper_action["gripper.pos"] = 50.0  # Open position
         robot.send_action(open_gripper_action)
         time.sleep(2.0)
         
         # Close gripper
         print("\n=== Closing Gripper ===")
-        close_gripper_action = home_action.copy()
-        close_gripper_action["gripper.pos"] = -50.0  # Closed position
         robot.send_action(close_gripper_action)
         time.sleep(2.0)
         
-        # Move joints in sequence
+        # Move all joints together in one command
         print("\n=== Moving Joints ===")
-        joint_names = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
-        for joint_name in joint_names:
-            print(f"Moving {joint_name}...")
-            action = home_action.copy()
-            action[f"{joint_name}.pos"] = 30.0  # Move to +30%
-            robot.send_action(action)
-            time.sleep(2.0)
-            
-            # Return to home
-            robot.send_action(home_action)
-            time.sleep(2.0)
+        print(f"Moving {', '.join(joint_names)}...")
+        robot.send_action(sweep_action)
+        time.sleep(2.0)
+        
+        # Return to home
+        robot.send_action(home_action)
+        time.sleep(2.0)
         
         # Read final observation
         print("\n=== Final State ===")
-        final_obs = robot.get_observation()
-        for key, value in final_obs.items():
-            if ".pos" in key and "cam" not in key:
-                print(f"{key}: {value:.2f}%")
+        final_state = robot.get_state()
+        print_joint_state(final_state)
         
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
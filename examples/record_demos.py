@@ -4,9 +4,10 @@ Record demonstrations with Roarm robot using LeRobot's recording tools.
 This script shows how to use the LeRobot CLI for recording demonstrations.
 It provides different recording modes and configurations.
 """
-import subprocess
 import sys
 
+from lerobot_robot_roarm.cli import run_console_script
+
 
 def record_with_cli():
     """
@@ -42,8 +43,8 @@ def record_with_cli():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
+        run_console_script(cmd)
+    except RuntimeError as e:
         print(f"Recording failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -84,8 +85,8 @@ def record_with_teleoperation():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
+        run_console_script(cmd)
+    except RuntimeError as e:
         print(f"Recording failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -102,8 +103,12 @@ def manual_recording_example():
     from pathlib import Path
     from lerobot.dataset import LeRobotDataset
     from lerobot_robot_roarm import RoarmConfig, Roarm
+    import numpy as np
     import time
     
+    fps = 10
+    max_episode_seconds = 60
+    
     # Configuration
     config = RoarmConfig(
         roarm_type="roarm_m3",
@@ -118,6 +123,18 @@ def manual_recording_example():
     dataset_dir = Path("data/roarm_manual_demos")
     dataset_dir.mkdir(parents=True, exist_ok=True)
     
+    # One preallocated ring buffer shared by every episode. Each record holds
+    # all joints and camera frames of one step, so recording never reallocates
+    # and long episodes overwrite the oldest frames instead of exhausting RAM.
+    obs = robot.get_observation()
+    fields = list(obs)
+    frame_dtype = np.dtype([
+        (key, np.uint8, obs[key].shape) if key in robot.cameras else (key, np.float32)
+        for key in fields
+    ])
+    max_frames = fps * max_episode_seconds
+    frames = np.empty(max_frames, dtype=frame_dtype)
+    
     print("Manual recording mode")
     print("Press Enter to start recording an episode")
     print("Press Ctrl+C to stop the episode\n")
@@ -129,7 +146,8 @@ def manual_recording_example():
             input(f"Press Enter to start episode {episode_idx}...")
             
             print(f"Recording episode {episode_idx}...")
-            episode_data = []
+            write_idx = 0
+            count = 0
             
             try:
                 # Record loop
@@ -142,15 +160,30 @@ def manual_recording_example():
                     # 2. Send action to robot
                     # 3. Store (obs, action) pair
                     
-                    episode_data.append(obs)
+                    frames[write_idx] = tuple(obs[key] for key in fields)
+                    write_idx = (write_idx + 1) % max_frames
+                    count += 1
+                    if count == max_frames + 1:
+                        print(
+                            f"\nWarning: episode longer than {max_episode_seconds}s, "
+                            "overwriting its oldest frames"
+                        )
                     
-                    time.sleep(0.1)  # 10 Hz
+                    time.sleep(1.0 / fps)
                     
             except KeyboardInterrupt:
+                # Oldest-first view of the episode (zero-copy unless the buffer wrapped)
+                if count <= max_frames:
+                    episode_data = frames[:count]
+                else:
+                    episode_data = np.concatenate((frames[write_idx:], frames[:write_idx]))
+                
                 print(f"\nEpisode {episode_idx} stopped. Recorded {len(episode_data)} frames")
+                if count > max_frames:
+                    print(f"  (dropped the first {count - max_frames} frames)")
                 episode_idx += 1
                 
-                # Save episode data here
+                # Save episode data here, before the next episode reuses the buffer
                 # (This is simplified - use LeRobot's dataset tools in practice)
     
     finally:
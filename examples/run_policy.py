@@ -3,10 +3,12 @@ Run a trained policy on the Roarm robot.
 
 This script demonstrates how to run inference with a trained policy on the real robot.
 """
-import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+from lerobot_robot_roarm.cli import run_console_script
+
 
 def run_policy_cli():
     """
@@ -50,9 +52,9 @@ def run_policy_cli():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
+        run_console_script(cmd)
         print("\n✓ Policy execution completed!")
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n✗ Execution failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -60,6 +62,23 @@ def run_policy_cli():
         sys.exit(0)
 
 
+@lru_cache(maxsize=None)
+def _inference_device():
+    """
+    Resolve the inference device once and tune torch for it.
+
+    torch is imported lazily so the CLI entry points don't pay for it.
+    """
+    import torch
+    
+    if torch.cuda.is_available():
+        # Input shapes are fixed for the whole run, so let cuDNN pick the
+        # fastest kernels on the first step
+        torch.backends.cudnn.benchmark = True
+        return torch.device("cuda")
+    return torch.device("cpu")
+
+
 def run_policy_manual():
     """
     Manual policy execution with more control.
@@ -70,6 +89,9 @@ def run_policy_manual():
     import time
     from lerobot.policy import make_policy
     from lerobot_robot_roarm import RoarmConfig, Roarm
+    from lerobot_robot_roarm.timing import sleep_until
+    
+    fps = 30
     
     # Get checkpoint
     checkpoint = input("Enter checkpoint path: ").strip()
@@ -80,7 +102,7 @@ def run_policy_manual():
     
     # Load policy
     print("Loading policy...")
-    device = "cuda" if torch.cuda.is_available() else "cpu"
+    device = _inference_device()
     policy = make_policy(checkpoint, device=device)
     policy.eval()
     print(f"✓ Policy loaded on {device}")
@@ -95,6 +117,38 @@ def run_policy_manual():
     robot.connect()
     print("✓ Robot connected")
     
+    # Joint state is packed into one host buffer and moved to the device in a
+    # single copy per step (pinned so the copy can run asynchronously on CUDA).
+    # Two buffers alternate so a step never overwrites a copy still in flight.
+    use_cuda = device.type == "cuda"
+    pos_keys = tuple(robot.action_features)
+    cam_keys = tuple(robot.cameras)
+    # LeRobot's policy input schema: joints batched under "observation.state",
+    # each camera under "observation.images.<name>"
+    img_obs_keys = tuple(f"observation.images.{key}" for key in cam_keys)
+    pos_host = [
+        torch.empty(len(pos_keys), dtype=torch.float32, pin_memory=use_cuda) for _ in range(2)
+    ]
+    pos_np = [buf.numpy() for buf in pos_host]
+    
+    # Camera frames get fixed (1, 3, H, W) pinned staging buffers as well, so
+    # each step is one HWC→CHW copy into pinned memory plus one H2D copy. The
+    # host buffer is only refilled after the previous step's action has been
+    # read back, by which point its copy has finished. The tensors handed to
+    # the policy are fresh every step: policies that queue observation
+    # history keep references to them, so they must not be overwritten.
+    img_host = {}
+    for key in cam_keys:
+        cam = robot.cameras[key]
+        img_host[key] = torch.empty(
+            (1, 3, cam.height, cam.width), dtype=torch.uint8, pin_memory=use_cuda
+        )
+    
+    if use_cuda:
+        # H2D copies run on their own stream; the forward pass waits on an event
+        copy_stream = torch.cuda.Stream()
+        copy_done = torch.cuda.Event()
+    
     try:
         # Run episodes
         num_episodes = int(input("How many episodes to run? "))
@@ -108,43 +162,68 @@ def run_policy_manual():
             
             # Episode loop
             step = 0
-            max_steps = 300  # 10 seconds at 30 Hz
+            max_steps = 10 * fps  # 10 seconds
+            dt_ns = 1_000_000_000 // fps
             
             print("Running policy...")
             
-            while step < max_steps:
-                try:
-                    # Get observation
-                    obs = robot.get_observation()
-                    
-                    # Prepare observation for policy
-                    # Convert to torch tensors and add batch dimension
-                    policy_obs = {}
-                    for key, value in obs.items():
-                        if ".pos" in key:
-                            policy_obs[key] = torch.tensor([value], device=device).unsqueeze(0)
-                        elif "cam" in key:
-                            # Convert image to tensor
-                            policy_obs[key] = torch.tensor(value, device=device).unsqueeze(0)
-                    
-                    # Get action from policy
-                    with torch.no_grad():
+            robot_state = robot.get_state()
+            deadline = time.monotonic_ns()
+            
+            # Inference mode for the whole episode: no autograd bookkeeping and
+            # a single context enter/exit instead of one per step
+            with torch.inference_mode():
+                while step < max_steps:
+                    try:
+                        # Prepare observation for policy
+                        # Convert to torch tensors and add batch dimension
+                        buf = step % 2
+                        pos_np[buf][:] = robot_state.joint_pos
+                        for key in cam_keys:
+                            img_host[key][0].copy_(torch.from_numpy(robot_state.cameras[key]).permute(2, 0, 1))
+                        if use_cuda:
+                            with torch.cuda.stream(copy_stream):
+                                state = pos_host[buf].to(device, non_blocking=True)
+                                images = {
+                                    key: img_host[key].to(device, non_blocking=True)
+                                    for key in cam_keys
+                                }
+                                copy_done.record()
+                            torch.cuda.current_stream().wait_event(copy_done)
+                            state.record_stream(torch.cuda.current_stream())
+                            for img in images.values():
+                                img.record_stream(torch.cuda.current_stream())
+                        else:
+                            state = pos_host[buf].clone()
+                            images = {key: img_host[key].clone() for key in cam_keys}
+                        policy_obs = {"observation.state": state.unsqueeze(0)}
+                        for key, obs_key in zip(cam_keys, img_obs_keys):
+                            policy_obs[obs_key] = images[key]
+                        
+                        # Get action from policy (kernels are queued asynchronously on CUDA)
                         action = policy.select_action(policy_obs)
-                    
-                    # Convert action to dict
-                    action_dict = {}
-                    for key, value in action.items():
-                        action_dict[key] = value.cpu().numpy()[0]
-                    
-                    # Send action to robot
-                    robot.send_action(action_dict)
-                    
-                    step += 1
-                    time.sleep(1.0 / 30.0)  # 30 Hz
-                    
-                except KeyboardInterrupt:
-                    print("\nEpisode interrupted")
-                    break
+                        
+                        # Read the next observation while the forward pass runs on the GPU
+                        robot_state = robot.get_state()
+                        
+                        # Convert action to dict (one device→host copy for all joints)
+                        action_dict = dict(zip(pos_keys, action.squeeze(0).cpu().tolist()))
+                        
+                        # Send action to robot
+                        robot.send_action(action_dict)
+                        
+                        step += 1
+                        
+                        # Pace to an absolute deadline; skip missed ticks after an overrun
+                        deadline += dt_ns
+                        now = time.monotonic_ns()
+                        if now > deadline:
+                            deadline = now
+                        sleep_until(deadline)
+                        
+                    except KeyboardInterrupt:
+                        print("\nEpisode interrupted")
+                        break
             
             print(f"Episode completed ({step} steps)")
     
@@ -188,9 +267,9 @@ def evaluate_policy():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
+        run_console_script(cmd)
         print("\n✓ Evaluation completed!")
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n✗ Evaluation failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -7,10 +7,14 @@ where one acts as a leader (teleoperator) and the other as a follower.
 Note: This example uses LeRobot's teleoperation framework. For direct control,
 use the lerobot-teleoperate command instead (see README.md).
 """
+import gc
+import signal
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from lerobot_robot_roarm import RoarmConfig, Roarm
+from lerobot_robot_roarm.timing import make_current_thread_realtime, sleep_until
 
 
 class RoarmTeleop:
@@ -24,19 +28,30 @@ class RoarmTeleop:
         self, 
         leader_config: RoarmConfig,
         follower_config: RoarmConfig,
-        control_rate: float = 10.0  # Hz
+        control_rate: float = 10.0,  # Hz
+        cpu_cores: set[int] | None = None,
+        rt_priority: int = 80,
     ):
         """
         Args:
             leader_config: Configuration for leader robot
             follower_config: Configuration for follower robot
             control_rate: Control loop frequency in Hz
+            cpu_cores: CPUs to pin the control and I/O threads to (ideally isolated)
+            rt_priority: SCHED_FIFO priority for the control and I/O threads
         """
         self.leader = Roarm(leader_config)
         self.follower = Roarm(follower_config)
         self.control_rate = control_rate
+        self.cpu_cores = cpu_cores
+        self.rt_priority = rt_priority
         self.running = False
         self.thread = None
+        self._pool = None
+        
+        # Joint keys mirrored leader → follower, resolved once in start()
+        self._joint_keys: tuple[str, ...] = ()
+        self._action: dict[str, float] = {}
     
     def start(self):
         """Start teleoperation."""
@@ -51,6 +66,22 @@ class RoarmTeleop:
         self.follower.connect(calibrate=False)
         print("✓ Follower ready")
         
+        # Fixed schema: resolve the mirrored keys once instead of filtering every tick
+        self._joint_keys = tuple(self.leader.action_features)
+        self._action = {key: 0.0 for key in self._joint_keys}
+        
+        # One worker per serial port: leader read and follower write overlap
+        self._pool = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="roarm-teleop",
+            initializer=self._make_realtime,
+        )
+        
+        # No automatic GC pauses while teleoperating; the control loop
+        # collects in its own idle time, and freezing keeps those passes short
+        gc.freeze()
+        gc.disable()
+        
         # Start control loop
         self.running = True
         self.thread = threading.Thread(target=self._control_loop)
@@ -69,39 +100,72 @@ class RoarmTeleop:
         if self.thread is not None:
             self.thread.join(timeout=2.0)
         
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        
+        gc.enable()
+        gc.unfreeze()
+        
         # Disconnect robots
         self.leader.disconnect()
         self.follower.disconnect()
         print("✓ Teleoperation stopped")
     
+    def _make_realtime(self):
+        """Pin the calling thread and raise it to SCHED_FIFO (best effort)."""
+        make_current_thread_realtime(self.cpu_cores, self.rt_priority)
+    
     def _control_loop(self):
-        """Main control loop."""
-        dt = 1.0 / self.control_rate
+        """
+        Main control loop.
+        
+        Pipelined over the two serial ports: while the leader is read for
+        tick N, the follower is sent the action read at tick N-1. Both
+        transfers complete before the shared action buffer is refilled, and
+        each robot only ever has one request in flight. pyserial drops the
+        GIL while blocked in read()/write(), so the transfers on the two
+        ports really do proceed in parallel.
+        """
+        self._make_realtime()
+        
+        dt_ns = int(1e9 / self.control_rate)
+        deadline = time.monotonic_ns()
+        next_gc_ns = deadline + 1_000_000_000
+        action = self._action
+        have_action = False
         
         while self.running:
-            start_time = time.time()
+            futures = [self._pool.submit(self.leader.get_observation)]
+            if have_action:
+                futures.append(self._pool.submit(self.follower.send_action, action))
+            wait(futures)
             
             try:
-                # Read leader position
-                leader_obs = self.leader.get_observation()
-                
-                # Extract joint positions
-                action = {}
-                for key, value in leader_obs.items():
-                    if ".pos" in key and "cam" not in key:
-                        action[key] = value
+                # Copy joint positions into the reused action buffer
+                leader_obs = futures[0].result()
+                for key in self._joint_keys:
+                    action[key] = leader_obs[key]
+                have_action = True
                 
-                # Send to follower
-                self.follower.send_action(action)
+                # Surface follower write errors
+                for future in futures[1:]:
+                    future.result()
                 
             except Exception as e:
                 print(f"Control loop error: {e}")
             
-            # Maintain control rate
-            elapsed = time.time() - start_time
-            sleep_time = dt - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # Maintain control rate on an absolute schedule so jitter doesn't accumulate
+            deadline += dt_ns
+            now = time.monotonic_ns()
+            if now > deadline:
+                # Overran the period: skip missed ticks instead of bursting to catch up
+                deadline = now
+            # Automatic GC is off: collect at most once a second, and only
+            # when at least half a period is left before the next tick
+            elif now >= next_gc_ns and deadline - now > dt_ns // 2:
+                gc.collect()
+                next_gc_ns = now + 1_000_000_000
+            sleep_until(deadline)
 
 
 def main():
@@ -138,16 +202,23 @@ def main():
         control_rate=10.0  # 10 Hz control rate
     )
     
+    stop_event = threading.Event()
+    
     try:
         # Start teleoperation
         teleop.start()
         
-        # Keep running until interrupted
-        while True:
-            time.sleep(0.1)
-            
-    except KeyboardInterrupt:
+        # While teleop runs, Ctrl+C just sets the event. The handler is only
+        # installed here so Ctrl+C still interrupts start() and stop(), and the
+        # wait is timed because an untimed wait can't be interrupted on Windows.
+        previous_handler = signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        try:
+            while not stop_event.wait(0.5):
+                pass
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
         print("\n\nInterrupted by user")
+        
     except Exception as e:
         print(f"\n\nError: {e}")
         import traceback
@@ -3,10 +3,11 @@ Train a policy using recorded Roarm demonstrations.
 
 This script demonstrates how to train a policy using LeRobot's training tools.
 """
-import subprocess
 import sys
 from pathlib import Path
 
+from lerobot_robot_roarm.cli import run_console_script
+
 
 def train_act_policy():
     """
@@ -56,9 +57,9 @@ def train_act_policy():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
+        run_console_script(cmd)
         print("\n✓ Training completed successfully!")
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n✗ Training failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -100,9 +101,9 @@ def train_diffusion_policy():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
+        run_console_script(cmd)
         print("\n✓ Training completed successfully!")
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n✗ Training failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -144,9 +145,9 @@ def train_simple_policy():
     print(f"Command: {' '.join(cmd)}\n")
     
     try:
-        subprocess.run(cmd, check=True)
+        run_console_script(cmd)
         print("\n✓ Training completed successfully!")
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n✗ Training failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -164,16 +165,16 @@ def resume_training():
         sys.exit(1)
     
     cmd = [
-        "python", "-m", "lerobot.scripts.train",
+        "lerobot-train",
         "--resume-from-checkpoint", checkpoint_path,
     ]
     
     print(f"Resuming training from {checkpoint_path}...")
     
     try:
-        subprocess.run(cmd, check=True)
+        run_console_script(cmd)
         print("\n✓ Training completed successfully!")
-    except subprocess.CalledProcessError as e:
+    except RuntimeError as e:
         print(f"\n✗ Training failed: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
@@ -1,7 +1,9 @@
 # Import configs FIRST to register them before any potential import errors
 from .config_roarm import RoarmConfig
 from .config_roarm_teleoperator import RoarmTeleoperatorConfig
+from .serial_utils import enable_low_latency, sdk_fileno
+from ._serial_pump import RoarmWriter, SerialPump
 
 # Then import the actual implementations (these might fail if dependencies missing)
-from .roarm import Roarm
+from .roarm import Roarm, RoarmObservation
 from .roarm_teleoperator import RoarmTeleoperator
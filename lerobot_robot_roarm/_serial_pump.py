@@ -0,0 +1,172 @@
+"""
+Background threads that take Roarm serial I/O off the control loop.
+
+The SDK's getters block for a full serial request/reply, and a control loop
+that calls them inline stalls for every round-trip. ``SerialPump`` moves
+those calls onto a daemon thread and publishes each result by swapping a
+single reference, so readers get the newest sample without touching the
+port or taking a lock. ``RoarmWriter`` is the mirror image for commands.
+"""
+import logging
+import queue
+import threading
+import time
+
+from .timing import sleep_until
+
+logger = logging.getLogger(__name__)
+
+
+class SerialPump:
+    """
+    Poll ``joints_angle_get()`` (and optionally ``pose_get()``) on a thread.
+
+    The SDK owns the serial port and its framing, so the pump sits at the
+    SDK call boundary: it never reads the file descriptor itself and can't
+    steal bytes from a request made elsewhere. Share ``lock`` with any other
+    code that talks to the same SDK object.
+
+    Attributes:
+        joints: Latest joint angles in degrees, or None before the first read
+        pose: Latest Cartesian pose, or None (only when ``read_pose`` is set)
+        stamp: ``time.monotonic()`` of the latest successful read
+    """
+
+    def __init__(
+        self,
+        sdk,
+        poll_hz: float = 200.0,
+        read_pose: bool = False,
+        lock=None,
+    ):
+        if poll_hz <= 0:
+            raise ValueError(f"poll_hz must be positive, got {poll_hz}")
+        self.sdk = sdk
+        self.poll_hz = poll_hz
+        self.read_pose = read_pose
+        self.lock = lock if lock is not None else threading.Lock()
+
+        self.joints: tuple[float, ...] | None = None
+        self.pose: tuple[float, ...] | None = None
+        self.stamp = 0.0
+
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._ready = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, timeout: float | None = 1.0) -> None:
+        """Start polling and wait up to ``timeout`` seconds for the first sample."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name="roarm-pump", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._running = False
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        period_ns = int(1e9 / self.poll_hz)
+        deadline = time.monotonic_ns()
+        failures = 0
+        while self._running:
+            try:
+                with self.lock:
+                    joints = self.sdk.joints_angle_get()
+                    pose = self.sdk.pose_get() if self.read_pose else None
+                if joints:
+                    self.joints = tuple(joints)
+                    if pose:
+                        self.pose = tuple(pose)
+                    self.stamp = time.monotonic()
+                    self._ready.set()
+                    if failures:
+                        logger.info("Serial pump recovered after %d failed reads", failures)
+                        failures = 0
+            except Exception as e:
+                # Warn once per outage rather than at the poll rate
+                if not failures:
+                    logger.warning("Serial pump read failed: %s", e)
+                failures += 1
+
+            deadline += period_ns
+            now = time.monotonic_ns()
+            if now > deadline:
+                deadline = now
+            sleep_until(deadline)
+
+
+_STOP = object()
+
+
+class RoarmWriter:
+    """
+    Send one SDK command type from a thread, latest value wins.
+
+    ``post()`` never blocks: it replaces any value that hasn't been written
+    yet, so a producer running faster than the serial link always has its
+    newest command go out next and stale ones are dropped. Hold ``lock``
+    around any other call on the same SDK object.
+
+    Example:
+        writer = RoarmWriter(sdk, "pose_ctrl")
+        writer.start()
+        writer.post(pose)
+        writer.close()
+    """
+
+    def __init__(self, sdk, command: str = "pose_ctrl", lock=None, **kwargs):
+        self.sdk = sdk
+        self.lock = lock if lock is not None else threading.Lock()
+        self._send = getattr(sdk, command)
+        self._kwargs = kwargs
+        self._slot: queue.Queue = queue.Queue(maxsize=1)
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="roarm-writer", daemon=True)
+        self._thread.start()
+
+    def post(self, value) -> None:
+        """Queue ``value`` for sending, discarding any unsent older value."""
+        try:
+            self._slot.get_nowait()
+            self._slot.task_done()
+        except queue.Empty:
+            pass
+        self._slot.put_nowait(value)
+
+    def close(self, flush: bool = True) -> None:
+        """Stop the thread, by default after the pending value has been sent."""
+        if self._thread is None:
+            return
+        if flush:
+            self._slot.join()
+        self.post(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            value = self._slot.get()
+            try:
+                if value is _STOP:
+                    return
+                with self.lock:
+                    self._send(value, **self._kwargs)
+            except Exception as e:
+                logger.warning("Roarm writer command failed: %s", e)
+            finally:
+                self._slot.task_done()
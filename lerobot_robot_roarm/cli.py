@@ -0,0 +1,39 @@
+"""
+Run LeRobot command-line tools in the current process.
+"""
+import sys
+from importlib.metadata import entry_points
+
+
+def run_console_script(cmd: list[str]) -> None:
+    """
+    Run a console-script command (e.g. ``lerobot-record``) in this process.
+
+    Equivalent to ``subprocess.run(cmd, check=True)`` but skips interpreter
+    startup and re-importing torch, and keeps CUDA/dataset state warm across
+    repeated calls.
+
+    Args:
+        cmd: Command name followed by its arguments
+
+    Raises:
+        RuntimeError: If the command isn't installed, exits with a non-zero status
+            or raises.
+    """
+    matches = entry_points(group="console_scripts", name=cmd[0])
+    if not matches:
+        raise RuntimeError(f"Command not found: {cmd[0]}")
+    main = next(iter(matches)).load()
+
+    saved_argv = sys.argv
+    sys.argv = list(cmd)
+    try:
+        main()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"{cmd[0]} exited with status {e.code}") from None
+    except Exception as e:
+        # A subprocess would have reported this as a non-zero exit too
+        raise RuntimeError(f"{cmd[0]} failed: {e}") from e
+    finally:
+        sys.argv = saved_argv
@@ -20,6 +20,11 @@ class RoarmConfig(RobotConfig):
     port: str | None = None   # serial, e.g. "/dev/ttyUSB0"
     baudrate: int = 115200
     host: str | None = None   # WiFi, e.g. "192.168.86.43"
+    low_latency: bool = True  # serial only: ASYNC_LOW_LATENCY + 1 ms FTDI latency timer
+
+    # Shared connection: if this UNIX socket exists, talk to a running
+    # `python -m lerobot_robot_roarm.daemon` instead of opening port/host
+    daemon_socket: str | None = None
 
     # Joint names (in SDK order)
     joint_names: list[str] = field(default_factory=lambda: [
@@ -45,6 +50,10 @@ class RoarmConfig(RobotConfig):
     default_speed: int = 1000
     default_acc: int = 50
 
+    # If set, poll observations on a background thread at this rate and have
+    # get_observation() return the latest sample instead of blocking on I/O
+    obs_poll_hz: float | None = None
+
     # Gripper
     has_gripper: bool = True
     gripper_name: str = "gripper"
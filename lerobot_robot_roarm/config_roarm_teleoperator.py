@@ -22,6 +22,7 @@ class RoarmTeleoperatorConfig(TeleoperatorConfig):
     port: str | None = None    # serial, e.g. "/dev/ttyUSB0"
     baudrate: int = 115200
     host: str | None = None    # WiFi, e.g. "192.168.86.43"
+    low_latency: bool = True   # serial only: ASYNC_LOW_LATENCY + 1 ms FTDI latency timer
 
     # Joint names (must match follower robot joint order)
     joint_names: list[str] = field(default_factory=lambda: [
@@ -44,3 +45,16 @@ class RoarmTeleoperatorConfig(TeleoperatorConfig):
     # Gripper
     has_gripper: bool = True
     gripper_name: str = "gripper"
+
+    # Reuse a joint reading for this long (seconds) so back-to-back callers
+    # in one control tick share a single serial round-trip; 0 disables
+    angle_cache_ttl_s: float = 0.005
+
+    # Poll the leader on a background thread at this rate (Hz) so get_action()
+    # reads the latest sample from memory instead of waiting on serial
+    pump_hz: float | None = None
+
+    # While every joint stays within this many degrees of the reading behind
+    # the last action, return that action again instead of re-converting. Drops
+    # sub-deadband motion from the output; 0 (the default) disables
+    idle_deadband_deg: float = 0.0
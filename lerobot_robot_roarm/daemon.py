@@ -0,0 +1,223 @@
+"""
+Keep a Roarm connected between script runs.
+
+Opening the serial port can reset the Roarm's ESP32 controller (DTR/RTS
+auto-reset), so every example script pays the reboot and handshake again. This daemon owns the SDK
+connection and serves the handful of calls ``Roarm`` needs over a local
+UNIX socket. Point ``RoarmConfig.daemon_socket`` at it and ``Roarm`` proxies
+its SDK calls through the daemon instead of opening the port itself.
+
+Usage:
+    python -m lerobot_robot_roarm.daemon --port /dev/ttyUSB0 [--socket /tmp/roarm.sock] [--socket-mode 660]
+"""
+import argparse
+import logging
+import os
+import socket
+import struct
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/roarm.sock"
+
+# Fixed 64-byte frame used for both requests and replies:
+#   op/status (u8), value count (u8), speed (i32), acc (i32), 6 float64 values
+_FRAME = struct.Struct("<BBxxii6d4x")
+_MAX_VALUES = 6
+
+_OP_JOINTS_ANGLE_GET = 1
+_OP_GRIPPER_ANGLE_GET = 2
+_OP_JOINTS_ANGLE_CTRL = 3
+_OP_GRIPPER_ANGLE_CTRL = 4
+_OP_TORQUE_SET = 5
+
+_STATUS_OK = 0
+_STATUS_ERROR = 1
+
+
+def _pack(op: int, values=(), speed: int = 0, acc: int = 0) -> bytes:
+    n = len(values)
+    if n > _MAX_VALUES:
+        raise ValueError(f"At most {_MAX_VALUES} values per frame, got {n}")
+    padded = list(values) + [0.0] * (_MAX_VALUES - n)
+    return _FRAME.pack(op, n, speed, acc, *padded)
+
+
+def _unpack(frame: bytes) -> tuple[int, list[float], int, int]:
+    op, n, speed, acc, *values = _FRAME.unpack(frame)
+    return op, values[:n], speed, acc
+
+
+class RoarmDaemonClient:
+    """
+    Drop-in replacement for the ``roarm_sdk`` object, backed by the daemon.
+
+    Only implements the calls used by ``Roarm``. ``connect``/``disconnect``
+    just open and close the socket; the daemon keeps the robot connected.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        sock.connect(self.socket_path)
+        self._sock = sock
+
+    def disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _call(self, op: int, values=(), speed: int = 0, acc: int = 0) -> list[float]:
+        if self._sock is None:
+            raise ConnectionError(f"Not connected to Roarm daemon at {self.socket_path}")
+        with self._lock:
+            self._sock.send(_pack(op, values, speed, acc))
+            reply = self._sock.recv(_FRAME.size)
+        if not reply:
+            raise ConnectionError("Roarm daemon closed the connection")
+        status, result, _, _ = _unpack(reply)
+        if status != _STATUS_OK:
+            raise RuntimeError(f"Roarm daemon call {op} failed (see daemon log)")
+        return result
+
+    def joints_angle_get(self) -> list[float]:
+        return self._call(_OP_JOINTS_ANGLE_GET)
+
+    def gripper_angle_get(self) -> float | None:
+        result = self._call(_OP_GRIPPER_ANGLE_GET)
+        return result[0] if result else None
+
+    def joints_angle_ctrl(self, angles, speed: int, acc: int) -> None:
+        self._call(_OP_JOINTS_ANGLE_CTRL, angles, speed, acc)
+
+    def gripper_angle_ctrl(self, angle: float, speed: int, acc: int) -> None:
+        self._call(_OP_GRIPPER_ANGLE_CTRL, (angle,), speed, acc)
+
+    def torque_set(self, cmd: int) -> None:
+        self._call(_OP_TORQUE_SET, (cmd,))
+
+
+def _dispatch(sdk, op: int, values: list[float], speed: int, acc: int) -> list[float]:
+    if op == _OP_JOINTS_ANGLE_GET:
+        return list(sdk.joints_angle_get() or [])
+    if op == _OP_GRIPPER_ANGLE_GET:
+        angle = sdk.gripper_angle_get()
+        return [] if angle is None else [angle]
+    if op == _OP_JOINTS_ANGLE_CTRL:
+        sdk.joints_angle_ctrl(angles=values, speed=speed, acc=acc)
+        return []
+    if op == _OP_GRIPPER_ANGLE_CTRL:
+        sdk.gripper_angle_ctrl(angle=values[0], speed=speed, acc=acc)
+        return []
+    if op == _OP_TORQUE_SET:
+        sdk.torque_set(cmd=int(values[0]))
+        return []
+    raise ValueError(f"Unknown op {op}")
+
+
+def _serve_client(conn: socket.socket, sdk, sdk_lock: threading.Lock) -> None:
+    with conn:
+        while True:
+            frame = conn.recv(_FRAME.size)
+            if not frame:
+                return
+            op, values, speed, acc = _unpack(frame)
+            try:
+                with sdk_lock:
+                    result = _dispatch(sdk, op, values, speed, acc)
+                conn.send(_pack(_STATUS_OK, result))
+            except Exception as e:
+                logger.warning("Daemon call %d failed: %s", op, e)
+                conn.send(_pack(_STATUS_ERROR))
+
+
+def _claim_socket_path(socket_path: str) -> None:
+    """Remove a stale socket file, or raise if a daemon is still serving it."""
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        # Nothing listening: left behind by a daemon that didn't shut down cleanly
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A Roarm daemon is already running on {socket_path}")
+
+
+def serve(sdk, socket_path: str = DEFAULT_SOCKET_PATH, mode: int = 0o600) -> None:
+    """
+    Serve ``sdk`` on ``socket_path`` until interrupted. One thread per client.
+
+    Refuses to start if another daemon already answers on ``socket_path``.
+    The socket is restricted to ``mode`` (owner-only by default).
+    """
+    _claim_socket_path(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    server.bind(socket_path)
+    os.chmod(socket_path, mode)
+    server.listen()
+    sdk_lock = threading.Lock()
+    logger.info("✓ Roarm daemon listening on %s", socket_path)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(target=_serve_client, args=(conn, sdk, sdk_lock), daemon=True).start()
+    finally:
+        server.close()
+        os.unlink(socket_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--roarm-type", default="roarm_m3")
+    parser.add_argument("--port", help="Serial port, e.g. /dev/ttyUSB0")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--host", help="WiFi host, e.g. 192.168.86.43")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH)
+    parser.add_argument(
+        "--socket-mode", type=lambda s: int(s, 8), default=0o600,
+        help="Octal permissions for the socket (default: 600)",
+    )
+    args = parser.parse_args()
+
+    if (args.port is None) == (args.host is None):
+        parser.error("Specify exactly one of --port or --host")
+
+    # Check before opening the port: opening it can reset a running daemon's arm
+    try:
+        _claim_socket_path(args.socket)
+    except RuntimeError as e:
+        parser.exit(1, f"{e}\n")
+
+    from roarm_sdk.roarm import roarm as RoarmSDK
+
+    from .serial_utils import enable_low_latency, sdk_fileno
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.port is not None:
+        sdk = RoarmSDK(roarm_type=args.roarm_type, port=args.port, baudrate=args.baudrate)
+        enable_low_latency(args.port, event_char=ord("\n"), fd=sdk_fileno(sdk))
+    else:
+        sdk = RoarmSDK(roarm_type=args.roarm_type, host=args.host)
+
+    try:
+        serve(sdk, args.socket, args.socket_mode)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sdk.disconnect()
+
+
+if __name__ == "__main__":
+    main()
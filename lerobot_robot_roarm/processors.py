@@ -45,43 +45,50 @@ class RoarmJointNormalizer(ProcessorStep):
                 name: (-np.pi, np.pi) for name in joint_names
             }
         self.joint_ranges = joint_ranges
+        
+        missing = [name for name in joint_names if name not in joint_ranges]
+        if missing:
+            raise ValueError(f"No joint range given for: {missing}")
+        degenerate = [name for name in joint_names if joint_ranges[name][0] == joint_ranges[name][1]]
+        if degenerate:
+            raise ValueError(f"Joint range must have min != max: {degenerate}")
+        if output_range[0] == output_range[1]:
+            raise ValueError(f"Output range must have min != max, got {output_range}")
+        
+        # Precompute the affine maps (value * scale + offset) for every joint
+        # so forward/inverse are a single vectorized expression
+        self._keys = [f"{name}.pos" for name in joint_names]
+        mins = np.array([joint_ranges[name][0] for name in joint_names], dtype=np.float64)
+        maxs = np.array([joint_ranges[name][1] for name in joint_names], dtype=np.float64)
+        out_min, out_max = output_range
+        self._scale = (out_max - out_min) / (maxs - mins)
+        self._offset = out_min - mins * self._scale
+        self._inv_scale = 1.0 / self._scale
+        self._inv_offset = -self._offset * self._inv_scale
+    
+    def _apply(self, action: dict[str, Any], scale: np.ndarray, offset: np.ndarray) -> None:
+        """Apply value * scale + offset in place to every joint present in ``action``."""
+        present = [i for i, key in enumerate(self._keys) if key in action]
+        if not present:
+            return
+        
+        if len(present) < len(self._keys):
+            scale = scale[present]
+            offset = offset[present]
+        values = np.fromiter(
+            (action[self._keys[i]] for i in present), dtype=np.float64, count=len(present)
+        )
+        for i, value in zip(present, (values * scale + offset).tolist()):
+            action[self._keys[i]] = value
     
     def forward(self, transition: EnvTransition) -> EnvTransition:
         """Normalize joint positions."""
-        for joint_name in self.joint_names:
-            key = f"{joint_name}.pos"
-            if key in transition.action:
-                value = transition.action[key]
-                min_val, max_val = self.joint_ranges[joint_name]
-                
-                # Normalize to [0, 1]
-                normalized = (value - min_val) / (max_val - min_val)
-                
-                # Scale to output range
-                out_min, out_max = self.output_range
-                scaled = normalized * (out_max - out_min) + out_min
-                
-                transition.action[key] = scaled
-        
+        self._apply(transition.action, self._scale, self._offset)
         return transition
     
     def inverse(self, transition: EnvTransition) -> EnvTransition:
         """Denormalize joint positions."""
-        for joint_name in self.joint_names:
-            key = f"{joint_name}.pos"
-            if key in transition.action:
-                value = transition.action[key]
-                min_val, max_val = self.joint_ranges[joint_name]
-                
-                # Scale from output range to [0, 1]
-                out_min, out_max = self.output_range
-                normalized = (value - out_min) / (out_max - out_min)
-                
-                # Denormalize to original range
-                denormalized = normalized * (max_val - min_val) + min_val
-                
-                transition.action[key] = denormalized
-        
+        self._apply(transition.action, self._inv_scale, self._inv_offset)
         return transition
 
 
@@ -106,40 +113,32 @@ class RoarmGripperNormalizer(ProcessorStep):
         self.gripper_name = gripper_name
         self.gripper_range = gripper_range
         self.output_range = output_range
+        
+        min_val, max_val = gripper_range
+        out_min, out_max = output_range
+        if min_val == max_val:
+            raise ValueError(f"Gripper range must have min != max, got {gripper_range}")
+        if out_min == out_max:
+            raise ValueError(f"Output range must have min != max, got {output_range}")
+        
+        # Resolve the key and the affine map once instead of per call
+        self._key = f"{gripper_name}.pos"
+        self._scale = (out_max - out_min) / (max_val - min_val)
+        self._offset = out_min - min_val * self._scale
     
     def forward(self, transition: EnvTransition) -> EnvTransition:
         """Normalize gripper position."""
-        key = f"{self.gripper_name}.pos"
-        if key in transition.action:
-            value = transition.action[key]
-            min_val, max_val = self.gripper_range
-            
-            # Normalize to [0, 1]
-            normalized = (value - min_val) / (max_val - min_val)
-            
-            # Scale to output range
-            out_min, out_max = self.output_range
-            scaled = normalized * (out_max - out_min) + out_min
-            
-            transition.action[key] = scaled
+        action = transition.action
+        if self._key in action:
+            action[self._key] = action[self._key] * self._scale + self._offset
         
         return transition
     
     def inverse(self, transition: EnvTransition) -> EnvTransition:
         """Denormalize gripper position."""
-        key = f"{self.gripper_name}.pos"
-        if key in transition.action:
-            value = transition.action[key]
-            min_val, max_val = self.gripper_range
-            
-            # Scale from output range to [0, 1]
-            out_min, out_max = self.output_range
-            normalized = (value - out_min) / (out_max - out_min)
-            
-            # Denormalize to original range
-            denormalized = normalized * (max_val - min_val) + min_val
-            
-            transition.action[key] = denormalized
+        action = transition.action
+        if self._key in action:
+            action[self._key] = (action[self._key] - self._offset) / self._scale
         
         return transition
 
@@ -173,46 +172,60 @@ class RoarmActionSafety(ProcessorStep):
         self.max_gripper_velocity = max_gripper_velocity
         self.gripper_name = gripper_name
         self.dt = dt
-        self.last_positions = {}
+        
+        # Fixed schema: one slot per key, joints first. If the gripper is also
+        # listed as a joint it keeps the joint velocity limit.
+        keys = [f"{name}.pos" for name in joint_names]
+        max_velocity = [max_joint_velocity] * len(joint_names)
+        gripper_key = f"{gripper_name}.pos"
+        if gripper_key not in keys:
+            keys.append(gripper_key)
+            max_velocity.append(max_gripper_velocity)
+        self._keys = tuple(keys)
+        self._max_delta = np.array(max_velocity, dtype=np.float64) * dt
+        self._last_pos = np.full(len(self._keys), np.nan)  # NaN until first seen
+    
+    @property
+    def last_positions(self) -> dict[str, float]:
+        """Last limited position per key (a copy); keys not seen yet are absent."""
+        return {
+            key: value
+            for key, value in zip(self._keys, self._last_pos.tolist())
+            if not np.isnan(value)
+        }
+    
+    @last_positions.setter
+    def last_positions(self, positions: dict[str, float]) -> None:
+        self._last_pos[:] = np.nan
+        for i, key in enumerate(self._keys):
+            if key in positions:
+                self._last_pos[i] = positions[key]
+    
+    def reset(self) -> None:
+        """Forget the last positions, e.g. between episodes."""
+        self._last_pos[:] = np.nan
     
     def forward(self, transition: EnvTransition) -> EnvTransition:
         """Apply safety constraints."""
-        # Check joint velocities
-        for joint_name in self.joint_names:
-            key = f"{joint_name}.pos"
-            if key in transition.action:
-                target_pos = transition.action[key]
-                
-                # Limit velocity if we have last position
-                if key in self.last_positions:
-                    last_pos = self.last_positions[key]
-                    max_delta = self.max_joint_velocity * self.dt
-                    delta = target_pos - last_pos
-                    
-                    if abs(delta) > max_delta:
-                        # Clamp the delta
-                        delta = np.sign(delta) * max_delta
-                        target_pos = last_pos + delta
-                        transition.action[key] = target_pos
-                
-                self.last_positions[key] = target_pos
+        action = transition.action
+        present = [i for i, key in enumerate(self._keys) if key in action]
+        if not present:
+            return transition
         
-        # Check gripper velocity
-        gripper_key = f"{self.gripper_name}.pos"
-        if gripper_key in transition.action:
-            target_pos = transition.action[gripper_key]
-            
-            if gripper_key in self.last_positions:
-                last_pos = self.last_positions[gripper_key]
-                max_delta = self.max_gripper_velocity * self.dt
-                delta = target_pos - last_pos
-                
-                if abs(delta) > max_delta:
-                    delta = np.sign(delta) * max_delta
-                    target_pos = last_pos + delta
-                    transition.action[gripper_key] = target_pos
-            
-            self.last_positions[gripper_key] = target_pos
+        target = np.fromiter(
+            (action[self._keys[i]] for i in present), dtype=np.float64, count=len(present)
+        )
+        last = self._last_pos[present]
+        max_delta = self._max_delta[present]
+        
+        # Clamp each step to max_delta; joints seen for the first time pass through
+        limited = np.where(
+            np.isnan(last), target, last + np.clip(target - last, -max_delta, max_delta)
+        )
+        self._last_pos[present] = limited
+        
+        for i, value in zip(present, limited.tolist()):
+            action[self._keys[i]] = value
         
         return transition
     
@@ -221,6 +234,150 @@ class RoarmActionSafety(ProcessorStep):
         return transition
 
 
+def _fused_step_numpy(values, idx, scale, offset, max_delta, last_pos):
+    """Normalize ``values`` (slots ``idx``) and clamp each step to ``max_delta``."""
+    target = values * scale[idx] + offset[idx]
+    last = last_pos[idx]
+    limit = max_delta[idx]
+    limited = np.where(np.isnan(last), target, last + np.clip(target - last, -limit, limit))
+    last_pos[idx] = limited
+    return limited
+
+
+def _fused_step_loop(values, idx, scale, offset, max_delta, last_pos):
+    """Same as _fused_step_numpy as a single scalar loop, for numba to compile."""
+    out = np.empty_like(values)
+    for k in range(values.shape[0]):
+        i = idx[k]
+        value = values[k] * scale[i] + offset[i]
+        last = last_pos[i]
+        if not np.isnan(last):
+            if value > last + max_delta[i]:
+                value = last + max_delta[i]
+            elif value < last - max_delta[i]:
+                value = last - max_delta[i]
+        last_pos[i] = value
+        out[k] = value
+    return out
+
+
+# With a handful of joints the NumPy version is dominated by per-ufunc
+# dispatch; numba (optional: pip install numba) compiles the loop instead.
+# No fastmath — it would let the compiler drop the NaN check.
+try:
+    from numba import njit
+    _fused_step = njit(cache=True)(_fused_step_loop)
+except ImportError:
+    _fused_step = _fused_step_numpy
+
+
+class RoarmFusedActionStep(ProcessorStep):
+    """
+    Joint normalization, gripper normalization and safety clamping in one step.
+    
+    Produces the same result as RoarmJointNormalizer → RoarmGripperNormalizer
+    → RoarmActionSafety, but the two normalizations are folded into a single
+    affine map per key and the action dict is read and written only once.
+    """
+    
+    def __init__(
+        self,
+        joint_names: list[str],
+        gripper_name: str = "gripper",
+        joint_ranges: dict[str, tuple[float, float]] | None = None,
+        gripper_range: tuple[float, float] = (0.0, np.pi/2),
+        joint_output_range: tuple[float, float] = (-1.0, 1.0),
+        gripper_output_range: tuple[float, float] = (0.0, 1.0),
+        max_joint_velocity: float = 3.0,  # rad/s
+        max_gripper_velocity: float = 2.0,  # rad/s
+        dt: float = 0.1,
+    ):
+        """
+        Args:
+            joint_names: List of joint names
+            gripper_name: Name of gripper
+            joint_ranges: Dict mapping joint names to (min, max) tuples in radians
+            gripper_range: Gripper (min, max) range in radians
+            joint_output_range: Target range for normalized joint values
+            gripper_output_range: Target range for normalized gripper values
+            max_joint_velocity: Maximum joint velocity in rad/s
+            max_gripper_velocity: Maximum gripper velocity in rad/s
+            dt: Time step for velocity calculation
+        """
+        super().__init__()
+        joint_norm = RoarmJointNormalizer(joint_names, joint_ranges, joint_output_range)
+        gripper_norm = RoarmGripperNormalizer(gripper_name, gripper_range, gripper_output_range)
+        safety = RoarmActionSafety(
+            joint_names,
+            max_joint_velocity=max_joint_velocity,
+            max_gripper_velocity=max_gripper_velocity,
+            gripper_name=gripper_name,
+            dt=dt,
+        )
+        
+        # Compose the per-key affine maps in pipeline order: joint first, then
+        # gripper (a gripper listed as a joint goes through both, as before)
+        self._keys = safety._keys
+        self._scale = np.ones(len(self._keys))
+        self._offset = np.zeros(len(self._keys))
+        for i, key in enumerate(self._keys):
+            if key in joint_norm._keys:
+                j = joint_norm._keys.index(key)
+                self._scale[i] = joint_norm._scale[j]
+                self._offset[i] = joint_norm._offset[j]
+        
+        gripper_idx = self._keys.index(gripper_norm._key)
+        self._scale[gripper_idx] *= gripper_norm._scale
+        self._offset[gripper_idx] = self._offset[gripper_idx] * gripper_norm._scale + gripper_norm._offset
+        
+        self._max_delta = safety._max_delta
+        self._last_pos = safety._last_pos
+    
+    def reset(self) -> None:
+        """Forget the last positions, e.g. between episodes."""
+        self._last_pos[:] = np.nan
+    
+    def forward(self, transition: EnvTransition) -> EnvTransition:
+        """Normalize and apply safety constraints."""
+        action = transition.action
+        present = [i for i, key in enumerate(self._keys) if key in action]
+        if not present:
+            return transition
+        
+        values = np.fromiter(
+            (action[self._keys[i]] for i in present), dtype=np.float64, count=len(present)
+        )
+        limited = _fused_step(
+            values,
+            np.array(present, dtype=np.intp),
+            self._scale,
+            self._offset,
+            self._max_delta,
+            self._last_pos,
+        )
+        
+        for i, value in zip(present, limited.tolist()):
+            action[self._keys[i]] = value
+        
+        return transition
+    
+    def inverse(self, transition: EnvTransition) -> EnvTransition:
+        """Denormalize joint and gripper positions (safety is forward only)."""
+        action = transition.action
+        present = [i for i, key in enumerate(self._keys) if key in action]
+        if not present:
+            return transition
+        
+        values = np.fromiter(
+            (action[self._keys[i]] for i in present), dtype=np.float64, count=len(present)
+        )
+        denormalized = (values - self._offset[present]) / self._scale[present]
+        for i, value in zip(present, denormalized.tolist()):
+            action[self._keys[i]] = value
+        
+        return transition
+
+
 def create_roarm_action_processor(
     joint_names: list[str],
     gripper_name: str = "gripper",
@@ -239,6 +396,13 @@ def create_roarm_action_processor(
     Returns:
         Configured processor pipeline
     """
+    if normalize and apply_safety:
+        # Same transform as the three separate steps, in a single pass
+        return RobotProcessorPipeline(steps=[RoarmFusedActionStep(
+            joint_names=joint_names,
+            gripper_name=gripper_name,
+        )])
+    
     steps = []
     
     if normalize:
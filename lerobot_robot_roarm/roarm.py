@@ -2,7 +2,14 @@
 Roarm robot implementation for LeRobot >= 0.5.0.
 """
 import logging
-from typing import Any
+import os
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import numpy as np
 
@@ -11,9 +18,22 @@ from lerobot.robots.robot import Robot
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from .config_roarm import RoarmConfig
+from .daemon import RoarmDaemonClient
+from .serial_utils import enable_low_latency, sdk_fileno
+from .timing import sleep_until
 
 logger = logging.getLogger(__name__)
 
+# The firmware ends every JSON reply with a newline
+_SERIAL_FRAME_END = ord("\n")
+
+# A background observation older than this many poll periods (but at least
+# _OBS_STALE_MIN_S, since a camera read can outlast a short period) is stale
+_OBS_STALE_PERIODS = 5
+_OBS_STALE_MIN_S = 0.1
+# How long connect() waits for the first background observation
+_OBS_READY_TIMEOUT_S = 2.0
+
 try:
     from roarm_sdk.roarm import roarm as RoarmSDK
 except ImportError:
@@ -22,6 +42,12 @@ except ImportError:
     )
 
 
+def _clamp(value: float, lo: float, hi: float) -> float:
+    """Clamp a scalar without a NumPy ufunc dispatch."""
+    value = float(value)
+    return lo if value < lo else hi if value > hi else value
+
+
 # ---------------------------------------------------------------------------
 # Action modes — machine-readable contract (lerobot-action-space RFC)
 # ---------------------------------------------------------------------------
@@ -76,6 +102,19 @@ ROARM_ACTION_MODES = [
 ]
 
 
+class RoarmObservation(NamedTuple):
+    """
+    Robot state as arrays instead of a flat feature dict.
+
+    joint_pos[i] is the normalized position of joint_names[i] (same order as
+    action_features); cameras maps camera name → HxWx3 frame.
+    """
+
+    joint_pos: np.ndarray
+    joint_names: tuple[str, ...]
+    cameras: dict[str, np.ndarray]
+
+
 class Roarm(Robot):
     """
     Roarm robot (M1/M2/M3) for LeRobot >= 0.5.0.
@@ -94,7 +133,10 @@ class Roarm(Robot):
         super().__init__(config)
         self.config = config
 
-        if config.port is not None:
+        if config.daemon_socket is not None and os.path.exists(config.daemon_socket):
+            logger.info("Using Roarm daemon at %s", config.daemon_socket)
+            self.robot = RoarmDaemonClient(config.daemon_socket)
+        elif config.port is not None:
             self.robot = RoarmSDK(
                 roarm_type=config.roarm_type,
                 port=config.port,
@@ -107,6 +149,52 @@ class Roarm(Robot):
             )
 
         self.cameras = make_cameras_from_configs(config.cameras)
+        self._camera_list = tuple(self.cameras.values())
+        self._cam_pool: ThreadPoolExecutor | None = None
+
+        # SDK calls may come from the observation thread and the caller at
+        # once; the serial protocol is strictly request/reply
+        self._sdk_lock = threading.Lock()
+
+        # Optional background observation thread (config.obs_poll_hz)
+        self._obs_thread: threading.Thread | None = None
+        self._obs_running = False
+        self._obs_ready = threading.Event()
+        self._latest: tuple[RoarmObservation, float] | None = None
+
+        # Motor names in feature order (the gripper may already be a joint)
+        motor_names = list(config.joint_names)
+        if config.has_gripper and config.gripper_name not in motor_names:
+            motor_names.append(config.gripper_name)
+        self._motor_names = tuple(motor_names)
+
+        # Feature keys and joint limits, resolved once for the hot path.
+        # Joints without configured limits map [-100, +100] onto ±180°.
+        self._joint_keys = tuple(f"{j}.pos" for j in config.joint_names)
+        self._motor_keys = tuple(f"{j}.pos" for j in self._motor_names)
+        self._gripper_key = f"{config.gripper_name}.pos"
+        # Every observation has the same keys; copying a presized template is
+        # cheaper than growing a fresh dict each tick
+        self._obs_template: dict[str, Any] = dict.fromkeys(self._motor_keys + tuple(self.cameras))
+        self._gripper_joint_idx = (
+            config.joint_names.index(config.gripper_name)
+            if config.has_gripper and config.gripper_name in config.joint_names
+            else None
+        )
+        limits = [config.joint_limits_deg.get(j, (-180.0, 180.0)) for j in config.joint_names]
+        self._limits_min_deg = np.array([lo for lo, _ in limits], dtype=np.float64)
+        self._limits_max_deg = np.array([hi for _, hi in limits], dtype=np.float64)
+        # IK solution columns that are also configured joints, and their keys
+        ik_pairs = [
+            (i, config.joint_names.index(j))
+            for i, j in enumerate(config.ik_joint_names)
+            if j in config.joint_names
+        ]
+        self._ik_src = np.array([i for i, _ in ik_pairs], dtype=np.intp)
+        ik_dst = np.array([k for _, k in ik_pairs], dtype=np.intp)
+        self._ik_keys = tuple(self._joint_keys[k] for _, k in ik_pairs)
+        self._ik_min_deg = self._limits_min_deg[ik_dst]
+        self._ik_span_deg = self._limits_max_deg[ik_dst] - self._ik_min_deg
         self._is_connected = False
 
         # Optional FK/IK solver (loaded when urdf_path is set in config)
@@ -120,34 +208,36 @@ class Roarm(Robot):
                     target_frame_name=config.ee_frame_name,
                     joint_names=config.ik_joint_names,
                 )
-                logger.info(f"✓ FK/IK solver loaded from {config.urdf_path}")
+                logger.info("✓ FK/IK solver loaded from %s", config.urdf_path)
             except Exception as e:
-                logger.warning(f"Could not load kinematics solver: {e} — EE mode unavailable")
+                logger.warning("Could not load kinematics solver: %s — EE mode unavailable", e)
 
     # ------------------------------------------------------------------
-    # Features
+    # Features (fixed once the config and cameras are set, so cached).
+    # Returned as read-only mappings: the same object is shared by every
+    # caller, so copy it if you need to modify it.
     # ------------------------------------------------------------------
 
-    @property
-    def _motors_ft(self) -> dict[str, type]:
+    @cached_property
+    def _motors_ft(self) -> MappingProxyType:
         features = {f"{j}.pos": float for j in self.config.joint_names}
         if self.config.has_gripper:
             features[f"{self.config.gripper_name}.pos"] = float
-        return features
+        return MappingProxyType(features)
 
-    @property
-    def _cameras_ft(self) -> dict[str, tuple]:
-        return {
+    @cached_property
+    def _cameras_ft(self) -> MappingProxyType:
+        return MappingProxyType({
             cam: (self.cameras[cam].height, self.cameras[cam].width, 3)
             for cam in self.cameras
-        }
+        })
 
-    @property
-    def observation_features(self) -> dict:
-        return {**self._motors_ft, **self._cameras_ft}
+    @cached_property
+    def observation_features(self) -> MappingProxyType:
+        return MappingProxyType({**self._motors_ft, **self._cameras_ft})
 
-    @property
-    def action_features(self) -> dict:
+    @cached_property
+    def action_features(self) -> MappingProxyType:
         return self._motors_ft
 
     @property
@@ -161,7 +251,7 @@ class Roarm(Robot):
 
     @property
     def is_connected(self) -> bool:
-        cameras_connected = all(cam.is_connected for cam in self.cameras.values())
+        cameras_connected = all(cam.is_connected for cam in self._camera_list)
         return self._is_connected and cameras_connected
 
     def connect(self, calibrate: bool = True) -> None:
@@ -169,7 +259,7 @@ class Roarm(Robot):
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
         location = self.config.host or self.config.port
-        logger.info(f"Connecting to {self.config.roarm_type} @ {location}...")
+        logger.info("Connecting to %s @ %s...", self.config.roarm_type, location)
 
         try:
             self.robot.connect()
@@ -177,26 +267,66 @@ class Roarm(Robot):
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Roarm: {e}") from e
 
+        # Every SDK call is a serial round-trip; don't let the USB adapter
+        # pad each one to its latency timer. The daemon tunes its own port.
+        if (
+            self.config.low_latency
+            and self.config.port is not None
+            and not isinstance(self.robot, RoarmDaemonClient)
+        ):
+            enable_low_latency(
+                self.config.port, event_char=_SERIAL_FRAME_END, fd=sdk_fileno(self.robot)
+            )
+
         for cam in self.cameras.values():
             cam.connect()
 
-        logger.info(f"✓ Connected to {self.config.roarm_type} @ {location}")
+        # One worker per camera so frames are fetched in parallel
+        if self.cameras:
+            self._cam_pool = ThreadPoolExecutor(
+                max_workers=len(self.cameras), thread_name_prefix="roarm-cam"
+            )
+
+        if self.config.obs_poll_hz:
+            self._obs_running = True
+            self._obs_ready.clear()
+            self._obs_thread = threading.Thread(
+                target=self._obs_producer, name="roarm-obs", daemon=True
+            )
+            self._obs_thread.start()
+            if not self._obs_ready.wait(_OBS_READY_TIMEOUT_S):
+                self.disconnect()
+                raise ConnectionError(
+                    f"No observation from Roarm within {_OBS_READY_TIMEOUT_S:.1f}s of connecting"
+                )
+
+        logger.info("✓ Connected to %s @ %s", self.config.roarm_type, location)
 
     def disconnect(self) -> None:
         if not self._is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected")
 
+        if self._obs_thread is not None:
+            self._obs_running = False
+            self._obs_thread.join()
+            self._obs_thread = None
+            self._latest = None
+
+        if self._cam_pool is not None:
+            self._cam_pool.shutdown(wait=True)
+            self._cam_pool = None
+
         for cam in self.cameras.values():
             if cam.is_connected:
                 cam.disconnect()
 
         try:
             self.robot.disconnect()
-        except Exception:
-            pass
+        except Exception as e:
+            logger.debug("Error while disconnecting SDK: %s", e)
 
         self._is_connected = False
-        logger.info(f"✓ Disconnected from {self.config.roarm_type}")
+        logger.info("✓ Disconnected from %s", self.config.roarm_type)
 
     # ------------------------------------------------------------------
     # Calibration (no-op — Roarm has no motor calibration step)
@@ -221,24 +351,34 @@ class Roarm(Robot):
         if joint_name in self.config.joint_limits_deg:
             min_deg, max_deg = self.config.joint_limits_deg[joint_name]
             norm = (deg - min_deg) / (max_deg - min_deg) * 200.0 - 100.0
-            return float(np.clip(norm, -100.0, 100.0))
-        return float(np.clip(deg / 180.0 * 100.0, -100.0, 100.0))
+            return _clamp(norm, -100.0, 100.0)
+        return _clamp(deg / 180.0 * 100.0, -100.0, 100.0)
 
     def _norm_to_deg(self, norm: float, joint_name: str) -> float:
         """Normalized [-100, +100] → physical degrees."""
         if joint_name in self.config.joint_limits_deg:
             min_deg, max_deg = self.config.joint_limits_deg[joint_name]
-            pct = np.clip(norm, -100.0, 100.0)
-            return float(min_deg + (pct + 100.0) * (max_deg - min_deg) / 200.0)
-        return float(np.clip(norm / 100.0 * 180.0, -180.0, 180.0))
+            pct = _clamp(norm, -100.0, 100.0)
+            return min_deg + (pct + 100.0) * (max_deg - min_deg) / 200.0
+        return _clamp(norm / 100.0 * 180.0, -180.0, 180.0)
+
+    def _degs_to_norms(self, degs: np.ndarray) -> np.ndarray:
+        """Physical degrees → normalized [-100, +100] for all joints at once (SDK order)."""
+        norms = (degs - self._limits_min_deg) / (self._limits_max_deg - self._limits_min_deg) * 200.0 - 100.0
+        return np.clip(norms, -100.0, 100.0)
+
+    def _norms_to_degs(self, norms: np.ndarray) -> np.ndarray:
+        """Normalized [-100, +100] → physical degrees for all joints at once (SDK order)."""
+        pct = np.clip(norms, -100.0, 100.0)
+        return self._limits_min_deg + (pct + 100.0) * (self._limits_max_deg - self._limits_min_deg) / 200.0
 
     def _gripper_deg_to_norm(self, deg: float) -> float:
         """Gripper degrees [0–90] → normalized [0, 100]."""
-        return float(np.clip(deg / 90.0 * 100.0, 0.0, 100.0))
+        return _clamp(deg / 90.0 * 100.0, 0.0, 100.0)
 
     def _gripper_norm_to_deg(self, norm: float) -> float:
         """Normalized [0, 100] → gripper degrees [0–90]."""
-        return float(np.clip(norm / 100.0 * 90.0, 0.0, 90.0))
+        return _clamp(norm / 100.0 * 90.0, 0.0, 90.0)
 
     # ------------------------------------------------------------------
     # Observation
@@ -253,37 +393,118 @@ class Roarm(Robot):
             gripper:         normalized [0, 100]
             camera images:   HxWx3 arrays
         """
+        state = self.get_state()
+        obs = self._obs_template.copy()
+        obs.update(zip(self._motor_keys, state.joint_pos.tolist()))
+        obs.update(state.cameras)
+        return obs
+
+    def get_state(self) -> RoarmObservation:
+        """
+        Read current robot state as a RoarmObservation.
+
+        Same values as get_observation(), but joint positions come back as one
+        array so callers don't have to pick ".pos" keys out of a dict.
+        Joints that can't be read are reported as 0.0.
+
+        With config.obs_poll_hz set this returns the latest sample from the
+        background thread without blocking (see obs_freshness_s), and raises
+        RuntimeError once that sample is a few poll periods old.
+        """
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected")
 
-        obs: dict[str, Any] = {}
+        latest = self._latest
+        if latest is not None:
+            age = time.monotonic() - latest[1]
+            if age > max(_OBS_STALE_PERIODS / self.config.obs_poll_hz, _OBS_STALE_MIN_S):
+                raise RuntimeError(f"Roarm observation is {age * 1000:.0f} ms old; background reads failing")
+            return latest[0]
+        return self._read_state()
 
-        try:
-            angles = self.robot.joints_angle_get()
-            if angles:
-                for i, joint_name in enumerate(self.config.joint_names):
-                    obs[f"{joint_name}.pos"] = self._deg_to_norm(angles[i], joint_name)
-        except Exception as e:
-            logger.warning(f"Failed to read joint angles: {e}")
-            for joint_name in self.config.joint_names:
-                obs[f"{joint_name}.pos"] = 0.0
+    @property
+    def obs_freshness_s(self) -> float | None:
+        """Age in seconds of the latest background observation, or None if not polling."""
+        latest = self._latest
+        if latest is None:
+            return None
+        return time.monotonic() - latest[1]
+
+    def _obs_producer(self) -> None:
+        """Read observations at config.obs_poll_hz until disconnect()."""
+        period_ns = int(1e9 / self.config.obs_poll_hz)
+        deadline = time.monotonic_ns()
+        failures = 0
+        while self._obs_running:
+            try:
+                # Publish by swapping a single reference; readers never see a partial sample
+                self._latest = (self._read_state(strict=True), time.monotonic())
+                self._obs_ready.set()
+                if failures:
+                    logger.info("Background observation recovered after %d failures", failures)
+                    failures = 0
+            except Exception as e:
+                # Warn once per outage rather than at the poll rate
+                if not failures:
+                    logger.warning("Background observation failed: %s", e)
+                failures += 1
+
+            deadline += period_ns
+            now = time.monotonic_ns()
+            if now > deadline:
+                deadline = now
+            sleep_until(deadline)
+
+    def _read_state(self, strict: bool = False) -> RoarmObservation:
+        """
+        Read joints, gripper and cameras from the hardware.
 
-        if self.config.has_gripper:
+        Joints that can't be read are logged and reported as 0.0, unless
+        ``strict`` is set: then a failed read raises instead, so the
+        background thread can skip the sample and let it go stale.
+        """
+        # Start the camera reads first so they overlap the serial round-trips
+        cam_futures = {}
+        if self._cam_pool is not None:
+            cam_futures = {
+                cam_key: self._cam_pool.submit(cam.async_read)
+                for cam_key, cam in self.cameras.items()
+            }
+
+        joint_pos = np.zeros(len(self._motor_names))
+
+        with self._sdk_lock:
+            n = len(self.config.joint_names)
             try:
-                gripper_deg = self.robot.gripper_angle_get()
-                obs[f"{self.config.gripper_name}.pos"] = (
-                    self._gripper_deg_to_norm(gripper_deg)
-                    if gripper_deg is not None
-                    else 0.0
-                )
+                angles = self.robot.joints_angle_get()
+                # The SDK reports a failed read as -1 rather than raising
+                if not isinstance(angles, list) or len(angles) < n:
+                    raise RuntimeError(f"joints_angle_get() returned {angles!r}")
+                joint_pos[:n] = self._degs_to_norms(np.asarray(angles[:n], dtype=np.float64))
             except Exception as e:
-                logger.warning(f"Failed to read gripper: {e}")
-                obs[f"{self.config.gripper_name}.pos"] = 0.0
+                if strict:
+                    raise
+                logger.warning("Failed to read joint angles: %s", e)
+                joint_pos[:n] = 0.0
 
-        for cam_key, cam in self.cameras.items():
-            obs[cam_key] = cam.async_read()
+            if self.config.has_gripper:
+                gripper_idx = self._motor_names.index(self.config.gripper_name)
+                try:
+                    gripper_deg = self.robot.gripper_angle_get()
+                    joint_pos[gripper_idx] = (
+                        self._gripper_deg_to_norm(gripper_deg)
+                        if gripper_deg is not None
+                        else 0.0
+                    )
+                except Exception as e:
+                    if strict:
+                        raise
+                    logger.warning("Failed to read gripper: %s", e)
+                    joint_pos[gripper_idx] = 0.0
 
-        return obs
+        cameras = {cam_key: future.result() for cam_key, future in cam_futures.items()}
+
+        return RoarmObservation(joint_pos, self._motor_names, cameras)
 
     # ------------------------------------------------------------------
     # Action
@@ -314,48 +535,100 @@ class Roarm(Robot):
 
     def _send_action_joints(self, action: dict[str, Any]) -> dict[str, Any]:
         """Send joint-space action (normalized [-100,+100])."""
-        sent: dict[str, Any] = {}
-        angles_deg = []
-
-        for joint_name in self.config.joint_names:
-            key = f"{joint_name}.pos"
+        norms = np.zeros(len(self._joint_keys))
+        missing = np.zeros(len(self._joint_keys), dtype=bool)
+        for i, key in enumerate(self._joint_keys):
             if key in action:
-                norm = float(action[key])
-                deg = self._norm_to_deg(norm, joint_name)
-                angles_deg.append(deg)
-                sent[key] = float(np.clip(norm, -100.0, 100.0))
+                norms[i] = action[key]
             else:
-                current = self.get_observation()
-                norm = current.get(key, 0.0)
-                angles_deg.append(self._norm_to_deg(norm, joint_name))
-                sent[key] = norm
+                missing[i] = True
+        norms = np.clip(norms, -100.0, 100.0)
+        angles_deg = self._norms_to_degs(norms)
+
+        # Joints left out of the action hold their current position (one
+        # serial read for all of them; 0.0 if it fails)
+        if missing.any():
+            current_deg = self._read_joint_positions()
+            if current_deg is not None:
+                gripper_deg = (
+                    current_deg[self._gripper_joint_idx]
+                    if self._gripper_joint_idx is not None
+                    else None
+                )
+                current_deg = np.clip(current_deg, self._limits_min_deg, self._limits_max_deg)
+                angles_deg[missing] = current_deg[missing]
+                norms[missing] = self._degs_to_norms(current_deg)[missing]
+                # A gripper joint reports in gripper units [0, 100], like get_observation()
+                if gripper_deg is not None and missing[self._gripper_joint_idx]:
+                    norms[self._gripper_joint_idx] = self._gripper_deg_to_norm(gripper_deg)
+
+        gripper_norm = None
+        if self.config.has_gripper and self._gripper_key in action:
+            gripper_norm = _clamp(action[self._gripper_key], 0.0, 100.0)
+            # When the gripper is one of the SDK joints, command it in the
+            # same joints_angle_ctrl frame instead of a second round-trip
+            if self._gripper_joint_idx is not None:
+                angles_deg[self._gripper_joint_idx] = self._gripper_norm_to_deg(gripper_norm)
+
+        self._write_joint_angles(angles_deg.tolist())
+        sent: dict[str, Any] = dict(zip(self._joint_keys, norms.tolist()))
+
+        if gripper_norm is not None:
+            sent[self._gripper_key] = gripper_norm
+            if self._gripper_joint_idx is None:
+                try:
+                    with self._sdk_lock:
+                        self.robot.gripper_angle_ctrl(
+                            angle=self._gripper_norm_to_deg(gripper_norm),
+                            speed=self.config.default_speed,
+                            acc=self.config.default_acc,
+                        )
+                except Exception as e:
+                    logger.warning("Failed to send gripper command: %s", e)
 
+        return sent
+
+    def _read_joint_positions(self) -> np.ndarray | None:
+        """Read joint angles in degrees (SDK order) — no gripper or camera reads."""
         try:
-            self.robot.joints_angle_ctrl(
-                angles=angles_deg,
-                speed=self.config.default_speed,
-                acc=self.config.default_acc,
-            )
-            # Update IK warm-start
-            self._ik_current_joints_deg = np.array(angles_deg[:len(self.config.ik_joint_names)])
+            with self._sdk_lock:
+                angles = self.robot.joints_angle_get()
+            if angles:
+                return np.asarray(angles[:len(self.config.joint_names)], dtype=np.float64)
         except Exception as e:
-            logger.warning(f"Failed to send joint command: {e}")
+            logger.warning("Failed to read joint angles: %s", e)
+        return None
 
-        if self.config.has_gripper:
-            gripper_key = f"{self.config.gripper_name}.pos"
-            if gripper_key in action:
-                norm = float(np.clip(action[gripper_key], 0.0, 100.0))
-                sent[gripper_key] = norm
-                try:
-                    self.robot.gripper_angle_ctrl(
-                        angle=self._gripper_norm_to_deg(norm),
-                        speed=self.config.default_speed,
-                        acc=self.config.default_acc,
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to send gripper command: {e}")
+    def send_joint_positions(self, positions: Sequence[float]) -> None:
+        """
+        Positional fast path for joint mode — no action dict in or out.
 
-        return sent
+        Args:
+            positions: one normalized [-100, +100] target per entry of
+                config.joint_names, in the same (SDK) order
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected")
+
+        joint_names = self.config.joint_names
+        if len(positions) != len(joint_names):
+            raise ValueError(f"Expected {len(joint_names)} positions, got {len(positions)}")
+
+        self._write_joint_angles(self._norms_to_degs(np.asarray(positions, dtype=np.float64)).tolist())
+
+    def _write_joint_angles(self, angles_deg: list[float]) -> None:
+        """Send one joint command (degrees, SDK order) and update the IK warm-start."""
+        try:
+            with self._sdk_lock:
+                self.robot.joints_angle_ctrl(
+                    angles=angles_deg,
+                    speed=self.config.default_speed,
+                    acc=self.config.default_acc,
+                )
+            # Update IK warm-start
+            self._ik_current_joints_deg = np.array(angles_deg[:len(self.config.ik_joint_names)])
+        except Exception as e:
+            logger.warning("Failed to send joint command: %s", e)
 
     def _send_action_ee(self, action: dict[str, Any]) -> dict[str, Any]:
         """Send end-effector pose action. Solves IK internally."""
@@ -377,16 +650,13 @@ class Roarm(Robot):
             self._ik_current_joints_deg, ee_pose
         )
 
-        # Map IK result (degrees) to normalized joint action
-        joint_action = {}
-        for i, joint_name in enumerate(self.config.ik_joint_names):
-            if joint_name in self.config.joint_names:
-                norm = self._deg_to_norm(float(joints_deg[i]), joint_name)
-                joint_action[f"{joint_name}.pos"] = norm
+        # Map IK result (degrees) to normalized joint action in one pass
+        norms = (np.asarray(joints_deg)[self._ik_src] - self._ik_min_deg) / self._ik_span_deg * 200.0 - 100.0
+        joint_action = dict(zip(self._ik_keys, np.clip(norms, -100.0, 100.0).tolist()))
 
         # Pass gripper through
         if "ee.gripper_pos" in action:
-            joint_action[f"{self.config.gripper_name}.pos"] = action["ee.gripper_pos"]
+            joint_action[self._gripper_key] = action["ee.gripper_pos"]
 
         sent = self._send_action_joints(joint_action)
         sent["ee.pose"] = ee_pose
@@ -399,7 +669,8 @@ class Roarm(Robot):
     def teleop_safety_stop(self) -> None:
         """Release torque (emergency stop)."""
         try:
-            self.robot.torque_set(cmd=0)
+            with self._sdk_lock:
+                self.robot.torque_set(cmd=0)
             logger.warning("Emergency stop activated!")
-        except Exception:
-            pass
+        except Exception as e:
+            logger.warning("Emergency stop failed, torque may still be on: %s", e)
@@ -8,6 +8,7 @@ to a Roarm follower robot.
 
 import logging
 import time
+from collections.abc import Sequence
 from typing import Any
 
 import numpy as np
@@ -16,11 +17,17 @@ from roarm_sdk import roarm as RoarmSDK
 from lerobot.teleoperators.teleoperator import Teleoperator
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
+from ._serial_pump import SerialPump
 from .config_roarm_teleoperator import RoarmTeleoperatorConfig
-from .roarm import ROARM_ACTION_MODES
+from .roarm import _OBS_STALE_MIN_S, _SERIAL_FRAME_END, ROARM_ACTION_MODES
+from .serial_utils import enable_low_latency, sdk_fileno
 
 logger = logging.getLogger(__name__)
 
+# A pump sample older than this many poll periods (but at least _OBS_STALE_MIN_S,
+# so one slow round-trip isn't an outage) means the leader stopped answering
+_PUMP_STALE_PERIODS = 5
+
 
 class RoarmTeleoperator(Teleoperator):
     """
@@ -42,6 +49,22 @@ class RoarmTeleoperator(Teleoperator):
         self.config = config
         self.roarm = None
         self._is_connected = False
+        self._angle_cache: list[float] | None = None
+        self._angle_cache_t = 0.0
+        self._pump: SerialPump | None = None
+        self._last_angles: tuple[float, ...] | None = None
+        self._last_action: dict[str, Any] | None = None
+
+        # Degrees → normalized as one affine map per joint, resolved once.
+        # Joints without configured limits map ±180° onto [-100, +100].
+        self._joint_keys = tuple(f"{j}.pos" for j in config.joint_names)
+        self._gripper_key = f"{config.gripper_name}.pos"
+        limits = [config.joint_limits_deg.get(j, (-180.0, 180.0)) for j in config.joint_names]
+        mins = np.array([lo for lo, _ in limits], dtype=np.float64)
+        maxs = np.array([hi for _, hi in limits], dtype=np.float64)
+        self._scale = 200.0 / (maxs - mins)
+        self._offset = -100.0 - mins * self._scale
+        self._norm_buf = np.empty(len(self._joint_keys), dtype=np.float64)
 
     # ------------------------------------------------------------------
     # Features
@@ -78,7 +101,7 @@ class RoarmTeleoperator(Teleoperator):
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
         location = self.config.host or self.config.port
-        logger.info(f"Connecting to Roarm teleoperator @ {location}...")
+        logger.info("Connecting to Roarm teleoperator @ %s...", location)
 
         if self.config.port:
             self.roarm = RoarmSDK(
@@ -86,6 +109,12 @@ class RoarmTeleoperator(Teleoperator):
                 port=self.config.port,
                 baudrate=self.config.baudrate,
             )
+            # The leader is polled every tick; don't pad each read to the
+            # adapter's latency timer (no-op on adapters without support)
+            if self.config.low_latency:
+                enable_low_latency(
+                    self.config.port, event_char=_SERIAL_FRAME_END, fd=sdk_fileno(self.roarm)
+                )
         elif self.config.host:
             self.roarm = RoarmSDK(
                 roarm_type=self.config.roarm_type,
@@ -94,25 +123,52 @@ class RoarmTeleoperator(Teleoperator):
         else:
             raise ValueError("Either 'port' or 'host' must be set in config.")
 
-        time.sleep(0.5)
+        self._wait_ready()
         self.roarm.torque_set(cmd=0)  # disable torque → allow manual movement
-        time.sleep(0.1)
+        self._wait_ready()
+
+        if self.config.pump_hz:
+            self._pump = SerialPump(self.roarm, poll_hz=self.config.pump_hz)
+            self._pump.start()
 
         self._is_connected = True
-        logger.info(f"✓ Connected (torque disabled, ready for manual control)")
+        logger.info("✓ Connected (torque disabled, ready for manual control)")
+
+    def _wait_ready(self, timeout: float = 1.0) -> bool:
+        """Poll joints_angle_get() until the arm answers with a full reading."""
+        expected = len(self.config.joint_names)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                angles = self.roarm.joints_angle_get()
+                if angles and len(angles) >= expected:
+                    return True
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                logger.warning("Roarm teleoperator not answering after %.1fs", timeout)
+                return False
+            time.sleep(0.02)
 
     def disconnect(self) -> None:
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected")
 
+        if self._pump is not None:
+            self._pump.stop()
+            self._pump = None
+
         try:
             self.roarm.torque_set(cmd=1)  # re-enable torque on disconnect
             time.sleep(0.1)
         except Exception as e:
-            logger.warning(f"Could not re-enable torque: {e}")
+            logger.warning("Could not re-enable torque: %s", e)
 
         self._is_connected = False
-        logger.info(f"✓ Disconnected from Roarm teleoperator")
+        self._angle_cache = None
+        self._last_angles = None
+        self._last_action = None
+        logger.info("✓ Disconnected from Roarm teleoperator")
 
     # ------------------------------------------------------------------
     # Calibration (no-op)
@@ -132,14 +188,17 @@ class RoarmTeleoperator(Teleoperator):
     # Unit conversion helpers (same logic as Roarm robot)
     # ------------------------------------------------------------------
 
-    def _deg_to_norm(self, deg: float, joint_name: str) -> float:
-        """Physical degrees → normalized [-100, +100]."""
-        limits = self.config.joint_limits_deg
-        if joint_name in limits:
-            min_deg, max_deg = limits[joint_name]
-            norm = (deg - min_deg) / (max_deg - min_deg) * 200.0 - 100.0
-            return float(np.clip(norm, -100.0, 100.0))
-        return float(np.clip(deg / 180.0 * 100.0, -100.0, 100.0))
+    def _degs_to_norms(self, degs) -> np.ndarray:
+        """
+        Physical degrees → normalized [-100, +100] for all joints at once.
+
+        Writes into a buffer reused across calls, so the result is only
+        valid until the next call.
+        """
+        out = self._norm_buf
+        np.multiply(degs, self._scale, out=out)
+        np.add(out, self._offset, out=out)
+        return np.clip(out, -100.0, 100.0, out=out)
 
     def _gripper_deg_to_norm(self, deg: float) -> float:
         """Gripper degrees [0–90] → normalized [0, 100]."""
@@ -149,6 +208,37 @@ class RoarmTeleoperator(Teleoperator):
     # Action
     # ------------------------------------------------------------------
 
+    def _read_angles(self) -> Sequence[float] | None:
+        """
+        joints_angle_get(), reusing the last reading for config.angle_cache_ttl_s.
+
+        With config.pump_hz set this returns the pump's latest sample and
+        raises RuntimeError once that sample is a few poll periods old.
+        """
+        pump = self._pump
+        if pump is not None:
+            joints = pump.joints
+            if joints is not None:
+                age = time.monotonic() - pump.stamp
+                if age > max(_PUMP_STALE_PERIODS / pump.poll_hz, _OBS_STALE_MIN_S):
+                    raise RuntimeError(
+                        f"Roarm teleoperator reading is {age * 1000:.0f} ms old; leader not answering"
+                    )
+            return joints
+
+        now = time.monotonic()
+        if self._angle_cache is not None and now - self._angle_cache_t < self.config.angle_cache_ttl_s:
+            return self._angle_cache
+
+        angles = self.roarm.joints_angle_get()
+        # The SDK reports a failed read as -1; never cache or return that
+        if not isinstance(angles, list):
+            return None
+        if angles:
+            self._angle_cache = angles
+            self._angle_cache_t = now
+        return angles
+
     def get_action(self) -> dict[str, Any]:
         """
         Read current joint positions from the leader arm.
@@ -159,24 +249,35 @@ class RoarmTeleoperator(Teleoperator):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected")
 
-        angles = self.roarm.joints_angle_get()
+        angles = self._read_angles()
         if not angles or len(angles) < len(self.config.joint_names):
             raise RuntimeError("Failed to read joint angles from Roarm teleoperator")
 
-        action: dict[str, Any] = {}
+        # A leader that's being held still doesn't need re-converting. Compare
+        # against the reading behind the cached action so slow drift can't
+        # accumulate past the deadband. Plain floats: a NumPy pass over six
+        # values costs as much as the conversion it skips.
+        deadband = self.config.idle_deadband_deg
+        last = self._last_angles
+        if deadband > 0 and last is not None and len(angles) == len(last):
+            if all(abs(a - b) < deadband for a, b in zip(angles, last)):
+                return dict(self._last_action)
 
-        for i, joint_name in enumerate(self.config.joint_names):
-            action[f"{joint_name}.pos"] = self._deg_to_norm(angles[i], joint_name)
+        n = len(self._joint_keys)
+        norms = self._degs_to_norms(angles[:n])
+        action: dict[str, Any] = dict(zip(self._joint_keys, norms.tolist()))
 
         if self.config.has_gripper:
-            gripper_key = f"{self.config.gripper_name}.pos"
-            gripper_idx = len(self.config.joint_names)
+            gripper_key = self._gripper_key
+            gripper_idx = n
             if len(angles) > gripper_idx:
                 action[gripper_key] = self._gripper_deg_to_norm(angles[gripper_idx])
             else:
                 action[gripper_key] = 0.0
 
-        return action
+        self._last_angles = tuple(angles)
+        self._last_action = action
+        return dict(action)
 
     def send_feedback(self, feedback: dict[str, Any]) -> None:
         pass
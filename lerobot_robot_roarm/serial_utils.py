@@ -0,0 +1,133 @@
+"""
+Serial transport helpers for Roarm robots.
+
+USB-serial adapters (FTDI, CH34x, CP210x) buffer incoming bytes for up to the
+driver's latency timer (16 ms by default on FTDI) before handing them to
+userspace. Every SDK round-trip pays that delay, so these helpers switch the
+port into low-latency mode.
+"""
+import array
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+# From <linux/serial.h>
+ASYNC_LOW_LATENCY = 1 << 13
+
+# Index of the ``flags`` field in ``struct serial_struct`` when viewed as ints
+_SERIAL_STRUCT_FLAGS_IDX = 4
+
+# Per-tty attributes exposed by the usb-serial drivers
+_USB_SERIAL_SYSFS = "/sys/bus/usb-serial/devices"
+
+
+def _set_async_low_latency(fd: int) -> bool:
+    """Set ASYNC_LOW_LATENCY on an open tty via TIOCGSERIAL / TIOCSSERIAL."""
+    import fcntl
+    import termios
+
+    if not hasattr(termios, "TIOCGSERIAL"):
+        return False
+
+    # struct serial_struct is 60-72 bytes depending on arch; 32 ints is ample
+    buf = array.array("i", [0] * 32)
+    fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+    buf[_SERIAL_STRUCT_FLAGS_IDX] |= ASYNC_LOW_LATENCY
+    fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+    return True
+
+
+def _set_latency_timer(port_path: str, latency_ms: int) -> bool:
+    """Write the FTDI latency timer through sysfs (requires write access)."""
+    tty = os.path.basename(os.path.realpath(port_path))
+    sysfs_path = os.path.join(_USB_SERIAL_SYSFS, tty, "latency_timer")
+    if not os.path.exists(sysfs_path):
+        return False
+
+    with open(sysfs_path, "w") as f:
+        f.write(str(latency_ms))
+    return True
+
+
+def _set_event_char(port_path: str, char: int) -> bool:
+    """Make an FTDI adapter flush its buffer as soon as ``char`` arrives."""
+    tty = os.path.basename(os.path.realpath(port_path))
+    sysfs_path = os.path.join(_USB_SERIAL_SYSFS, tty, "event_char")
+    if not os.path.exists(sysfs_path):
+        return False
+
+    # Bit 8 enables the event character, the low byte selects it
+    with open(sysfs_path, "w") as f:
+        f.write(str(0x100 | (char & 0xFF)))
+    return True
+
+
+def sdk_fileno(sdk) -> int | None:
+    """File descriptor of a ``roarm_sdk`` object's open serial port, or None."""
+    port = getattr(sdk, "_serial_port", None)
+    try:
+        return port.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def enable_low_latency(
+    port_path: str,
+    latency_ms: int = 1,
+    event_char: int | None = None,
+    fd: int | None = None,
+) -> bool:
+    """
+    Put a USB-serial port into low-latency mode (Linux only).
+
+    Sets ``ASYNC_LOW_LATENCY`` on the tty and, for FTDI adapters, lowers the
+    latency timer to ``latency_ms`` and optionally sets an event character
+    (typically the protocol's frame terminator) that flushes replies
+    immediately. Adapters that don't support a setting are left untouched.
+    Failures are logged, never raised, so this is safe to call on any port.
+
+    The tty flag is set through ``fd``, the port the SDK already has open
+    (see ``sdk_fileno``). The device node is never reopened here: opening
+    it raises DTR/RTS, which can reset the Roarm's ESP32 controller.
+
+    Args:
+        port_path: Serial device, e.g. "/dev/ttyUSB0"
+        latency_ms: FTDI latency timer in milliseconds (1-255)
+        event_char: Byte value that triggers an immediate flush, or None
+        fd: Open file descriptor for ``port_path``; without it the
+            ASYNC_LOW_LATENCY flag is skipped
+
+    Returns:
+        True if at least one setting was applied.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    applied = False
+
+    if fd is not None:
+        try:
+            applied |= _set_async_low_latency(fd)
+        except OSError as e:
+            logger.warning("Could not set ASYNC_LOW_LATENCY on %s: %s", port_path, e)
+
+    try:
+        applied |= _set_latency_timer(port_path, latency_ms)
+    except OSError as e:
+        logger.warning(
+            "Could not set latency_timer for %s: %s "
+            "(add a udev rule or run with write access to sysfs)",
+            port_path, e,
+        )
+
+    if event_char is not None:
+        try:
+            applied |= _set_event_char(port_path, event_char)
+        except OSError as e:
+            logger.warning("Could not set event_char for %s: %s", port_path, e)
+
+    if applied:
+        logger.info("✓ Low-latency mode enabled on %s", port_path)
+    return applied
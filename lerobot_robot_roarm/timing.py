@@ -0,0 +1,124 @@
+"""
+Timing helpers for fixed-rate control loops.
+
+Loops that do ``time.sleep(dt - elapsed)`` drift, because each period is
+measured from a fresh timestamp. Schedule against absolute deadlines on the
+monotonic clock instead and sleep until each deadline is reached.
+"""
+import atexit
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# From <time.h>
+_CLOCK_MONOTONIC = 1
+_TIMER_ABSTIME = 1
+_EINTR = 4
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_clock_nanosleep():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fn = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Timespec), ctypes.c_void_p]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_clock_nanosleep = _load_clock_nanosleep()
+
+_timer_period_raised = False
+
+
+def _end_timer_period() -> None:
+    try:
+        ctypes.windll.winmm.timeEndPeriod(1)
+    except (AttributeError, OSError):
+        pass
+
+
+def _raise_timer_resolution() -> None:
+    """
+    Raise the Windows timer resolution from ~15.6 ms to 1 ms for time.sleep().
+
+    The setting is system-wide, so it is only requested once something
+    actually sleeps on a deadline, and released again at interpreter exit.
+    """
+    global _timer_period_raised
+    if _timer_period_raised or sys.platform != "win32":
+        return
+    _timer_period_raised = True
+    try:
+        ctypes.windll.winmm.timeBeginPeriod(1)
+    except (AttributeError, OSError):
+        return
+    atexit.register(_end_timer_period)
+
+
+def sleep_until(deadline_ns: int) -> None:
+    """
+    Block until ``time.monotonic_ns()`` reaches ``deadline_ns``.
+
+    On Linux this is a single ``clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME)``
+    call, so wake-up error doesn't depend on how long the caller took to get
+    here. Elsewhere it falls back to ``time.sleep``; on Windows the first
+    call raises the timer resolution to 1 ms for the rest of the process.
+    """
+    if _clock_nanosleep is not None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        while _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None) == _EINTR:
+            pass
+        return
+
+    if not _timer_period_raised:
+        _raise_timer_resolution()
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1e9)
+
+
+def make_current_thread_realtime(cpu_cores: set[int] | None = None, priority: int = 80) -> bool:
+    """
+    Pin the calling thread to ``cpu_cores`` and switch it to ``SCHED_FIFO``.
+
+    Linux only. Raising the priority needs ``CAP_SYS_NICE`` (or an rtprio
+    limit in /etc/security/limits.conf); for the best results also isolate
+    the cores with ``isolcpus=`` on the kernel command line. Failures are
+    logged and the thread keeps running with its default scheduling.
+
+    Args:
+        cpu_cores: CPU indices to pin to, or None to leave affinity unchanged
+        priority: SCHED_FIFO priority (1-99)
+
+    Returns:
+        True if the realtime policy was applied.
+    """
+    if not hasattr(os, "sched_setscheduler"):
+        return False
+
+    # pid 0 targets the calling thread, not the whole process
+    if cpu_cores is not None:
+        try:
+            os.sched_setaffinity(0, cpu_cores)
+        except OSError as e:
+            logger.warning("Could not pin thread to CPUs %s: %s", sorted(cpu_cores), e)
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except OSError as e:
+        logger.warning("Could not set SCHED_FIFO priority %d: %s", priority, e)
+        return False
+    return True
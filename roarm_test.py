@@ -1,22 +1,102 @@
 from roarm_sdk.roarm import roarm
-#roarm1 = roarm(roarm_type="roarm_m3", host="192.168.86.43")
-#roarm2 = roarm(roarm_type="roarm_m3", host="192.168.86.55")
-roarm1 = roarm(roarm_type="roarm_m3", port="/dev/ttyUSB0", baudrate=115200)
-roarm2 = roarm(roarm_type="roarm_m3", port="/dev/ttyUSB1", baudrate=115200)
-roarm = roarm1  # Change to roarm2 to use serial connection
+import queue
 import threading
 import time
+from functools import partial
+
+# One entry per arm, opened on first use so a missing second arm doesn't
+# block the first
+SDK_ARGS = [
+    dict(roarm_type="roarm_m3", port="/dev/ttyUSB0", baudrate=115200),
+    dict(roarm_type="roarm_m3", port="/dev/ttyUSB1", baudrate=115200),
+    #dict(roarm_type="roarm_m3", host="192.168.86.43"),
+    #dict(roarm_type="roarm_m3", host="192.168.86.55"),
+]
+_sdks = {}
+
+def get_sdk(idx):
+    if idx not in _sdks:
+        _sdks[idx] = roarm(**SDK_ARGS[idx])
+    return _sdks[idx]
+
+TELEOP_PERIOD = 0.033  # ~30 Hz
+
+def _read_leader(roarm1, latest):
+    # Keep only the newest sample so the follower never replays stale angles
+    while not roarm1.stop_flag:
+        angles = roarm1.joints_angle_get()
+        # The SDK reports a failed read as -1, not an empty list
+        if not isinstance(angles, list) or len(angles) < 6:
+            # Don't spin on a silent arm and starve the follower thread
+            time.sleep(0.001)
+            continue
+        try:
+            latest.get_nowait()
+        except queue.Empty:
+            pass
+        latest.put_nowait(angles)
 
 def teleop(roarm1, roarm2):
     input_thread = threading.Thread(target=roarm1.listen_for_input)
     input_thread.daemon = True 
     input_thread.start()
     roarm1.torque_set(cmd=0)
+
+    # Leader reads run on their own thread, overlapping the follower writes
+    latest = queue.Queue(maxsize=1)
+    reader_thread = threading.Thread(target=_read_leader, args=(roarm1, latest), daemon=True)
+    reader_thread.start()
+
+    t0 = time.monotonic()
+    i = 0
     while not roarm1.stop_flag: 
-        roarm2.joints_angle_ctrl(angles=roarm1.joints_angle_get(), speed=1000, acc=50)
-        time.sleep(0.1)
+        try:
+            angles = latest.get(timeout=TELEOP_PERIOD)
+        except queue.Empty:
+            continue
+        roarm2.joints_angle_ctrl(angles=angles, speed=1000, acc=50)
+        i += 1
+        # Absolute deadlines: round-trip time doesn't stretch the period
+        delay = t0 + i * TELEOP_PERIOD - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            t0, i = time.monotonic(), 0
+    reader_thread.join()
     roarm1.stop_flag = False  # Reset stop flag for future use
 
+def _teleop():
+    teleop(get_sdk(0), get_sdk(1))
+
+def _show(getter):
+    print(getter())
+
+# Keys of the table returned by make_commands()
+ROBOT_COMMAND_KEYS = frozenset("0123456789wasdijk")
+
+def make_commands(robot, cmd, joint, radian, angle, gripper_radian, gripper_angle, speed, acc,
+                  radians, angles, filename, pose, ssid, password):
+    """Per-robot command table; each entry is bound to ``robot`` up front."""
+    return {
+        "0": robot.move_init,
+        "1": partial(robot.torque_set, cmd=cmd),
+        "2": partial(robot.joint_radian_ctrl, joint=joint, radian=radian, speed=speed, acc=acc),
+        "3": partial(robot.joints_radian_ctrl, radians=radians, speed=speed, acc=acc),
+        "4": partial(_show, robot.joints_radian_get),
+        "5": partial(robot.joint_angle_ctrl, joint=joint, angle=angle, speed=speed, acc=acc),
+        "6": partial(robot.joints_angle_ctrl, angles=angles, speed=speed, acc=acc),
+        "7": partial(_show, robot.joints_angle_get),
+        "8": partial(robot.drag_teach_start, filename=filename),
+        "9": partial(robot.drag_teach_replay, filename=filename),
+        "w": partial(robot.gripper_radian_ctrl, radian=gripper_radian, speed=speed, acc=acc),
+        "a": partial(_show, robot.gripper_radian_get),
+        "s": partial(robot.gripper_angle_ctrl, angle=gripper_angle, speed=speed, acc=acc),
+        "d": partial(_show, robot.gripper_angle_get),
+        "i": partial(robot.pose_ctrl, pose=pose),
+        "j": partial(_show, robot.pose_get),
+        "k": partial(robot.ap_set, ssid=ssid, password=password),
+    }
+
 def main():
     cmd = 0
     joint = 1
@@ -34,26 +114,12 @@ def main():
     ssid = "Garage"
     password = "Don12345!"
   
+    # Robot commands run on each arm in turn (tables built as arms are
+    # opened); the rest run once
+    robot_commands = {}
     commands = {
-        "0": lambda: roarm.move_init(),
-        "1": lambda: roarm.torque_set(cmd=cmd),
-        "2": lambda: roarm.joint_radian_ctrl(joint=joint, radian=radian, speed=speed, acc=acc),
-        "3": lambda: roarm.joints_radian_ctrl(radians=radians, speed=speed, acc=acc),
-        "4": lambda: print(roarm.joints_radian_get()),
-        "5": lambda: roarm.joint_angle_ctrl(joint=joint, angle=angle, speed=speed, acc=acc),
-        "6": lambda: roarm.joints_angle_ctrl(angles=angles, speed=speed, acc=acc),
-        "7": lambda: print(roarm.joints_angle_get()),
-        "8": lambda: roarm.drag_teach_start(filename=filename),
-        "9": lambda: roarm.drag_teach_replay(filename=filename),
-        "w": lambda: roarm.gripper_radian_ctrl(radian=gripper_radian, speed=speed, acc=acc),
-        "a": lambda: print(roarm.gripper_radian_get()),
-        "s": lambda: roarm.gripper_angle_ctrl(angle=gripper_angle, speed=speed, acc=acc),
-        "d": lambda: print(roarm.gripper_angle_get()),
-        "i": lambda: roarm.pose_ctrl(pose=pose),
-        "j": lambda: print(roarm.pose_get()),
-        "k": lambda: roarm.ap_set(ssid=ssid, password=password),
-        "t": lambda: teleop(roarm1, roarm2),
-        "q": lambda: exit()
+        "t": _teleop,
+        "q": exit,
     }
 
     while True:
@@ -80,10 +146,19 @@ def main():
         choice = input("Enter your choice: ").strip()
         
         if choice in commands:
-            roarm = roarm1
-            commands[choice]()
-            roarm = roarm2
             commands[choice]()
+        elif choice in ROBOT_COMMAND_KEYS:
+            for idx in range(len(SDK_ARGS)):
+                if idx not in robot_commands:
+                    try:
+                        robot = get_sdk(idx)
+                    except Exception as e:
+                        print(f"Robot {idx + 1} unavailable: {e}")
+                        continue
+                    robot_commands[idx] = make_commands(
+                        robot, cmd, joint, radian, angle, gripper_radian, gripper_angle, speed, acc,
+                        radians, angles, filename, pose, ssid, password)
+                robot_commands[idx][choice]()
         else:
             print("Invalid choice. Please try again.")
 
@@ -5,93 +5,164 @@ Test smooth Cartesian control on TWO robots simultaneously!
 This demonstrates synchronized choreography with dual arm coordination.
 
 Usage:
-    python test_cartesian_dual.py [port1] [port2] [duration_sec]
+    python test_cartesian_dual.py [port1] [port2] [duration_sec] [--low-latency] [--async-writes]
     
 Example:
-    python test_cartesian_dual.py /dev/ttyUSB0 /dev/ttyUSB1 10
+    python test_cartesian_dual.py /dev/ttyUSB0 /dev/ttyUSB1 10 --low-latency
+
+--low-latency puts both USB-serial ports in low-latency mode (1 ms instead of
+the 16 ms FTDI default); adapters that don't support it are left as-is.
+
+--async-writes sends poses through a latest-wins writer thread per robot, so
+the motion loop never waits on a serial write and late poses are dropped.
 """
 
+import contextlib
 import sys
 import time
-import math
-import threading
+import numpy as np
 from roarm_sdk import roarm as RoarmSDK
 
 
-def smooth_dual_motion(robot, robot_id, initial_pose, duration_sec=10, fps=30, cycles=3, invert_z=False):
+def motion_trajectory(initial_pose, progress, invert_z=False):
     """
-    Smooth vertical motion with yaw, pitch and LED synchronized.
+    Poses for the whole vertical motion with yaw and pitch, one row per step.
     
     Args:
-        robot: Robot instance
-        robot_id: "Robot 1" or "Robot 2" for logging
         initial_pose: Starting pose
+        progress: Motion phase in [-1, 1] for every step
+        invert_z: If True, invert Z motion (up becomes down)
+    
+    Returns:
+        (N, 6) array of poses
+    """
+    distance_mm = 180  # Reduced from 240 to avoid going too low
+    
+    # Invert Z motion if requested
+    z_progress = -progress if invert_z else progress
+    
+    poses = np.tile(np.asarray(initial_pose, dtype=np.float64), (len(progress), 1))
+    # Ensure Z stays positive
+    poses[:, 2] = np.maximum(50.0, initial_pose[2] + distance_mm * z_progress / 2.0)
+    # Yaw and pitch are NOT inverted - they stay synchronized
+    poses[:, 4] = np.clip(initial_pose[4] + 30.0 * progress, -85.0, 85.0)
+    poses[:, 5] = np.clip(initial_pose[5] + 15.0 * progress, 0.0, 85.0)
+    
+    return poses
+
+
+def smooth_dual_motion(robot1, robot2, initial_pose1, initial_pose2, duration_sec=10, fps=30, cycles=3,
+                       async_writes=False):
+    """
+    Smooth vertical motion on two robots, Robot 2 mirrored in Z.
+    
+    Both robots are driven from one loop: each step sends Robot 1's pose and
+    then Robot 2's back-to-back, so the two commands are only a serial write
+    apart and share a single deadline.
+    
+    Args:
+        robot1: Robot 1 instance (normal Z motion)
+        robot2: Robot 2 instance (inverted Z motion)
+        initial_pose1: Robot 1 starting pose
+        initial_pose2: Robot 2 starting pose
         duration_sec: Total duration
         fps: Frames per second
         cycles: Number of up/down cycles
-        invert_z: If True, invert Z motion (up becomes down)
+        async_writes: Post poses to a RoarmWriter thread per robot instead of
+            calling pose_ctrl inline
     """
-    distance_mm = 180  # Reduced from 240 to avoid going too low
     total_steps = int(duration_sec * fps)
     dt = 1.0 / fps
     
-    print(f"{robot_id} starting motion (Z inverted: {invert_z})")
+    # Whole trajectory computed up front; the loop only indexes and sends
+    progress = np.sin(2 * np.pi * cycles * np.arange(total_steps) / total_steps)
+    poses1 = motion_trajectory(initial_pose1, progress, invert_z=False).tolist()
+    poses2 = motion_trajectory(initial_pose2, progress, invert_z=True).tolist()
+    # LED control - on when near top (based on original progress, not inverted)
+    leds = np.where(progress > 0.85, 25, 0).tolist()  # 10% brightness
+    
+    print("Starting motion (Robot 2 Z inverted)")
+    
+    # Pace against absolute deadlines t0 + (i+1)*dt so serial time doesn't
+    # accumulate as drift
+    t0 = time.monotonic()
+    # Only send LED commands when the level changes; None forces the first one
+    led_state = None
+    
+    if async_writes:
+        from lerobot_robot_roarm import RoarmWriter
+        writer1 = RoarmWriter(robot1, "pose_ctrl")
+        writer2 = RoarmWriter(robot2, "pose_ctrl")
+        writer1.start()
+        writer2.start()
+        send1, send2 = writer1.post, writer2.post
+        lock1, lock2 = writer1.lock, writer2.lock
+    else:
+        send1, send2 = robot1.pose_ctrl, robot2.pose_ctrl
+        lock1 = lock2 = contextlib.nullcontext()
     
     for i in range(total_steps):
-        # Calculate progress
-        angle = 2 * math.pi * cycles * i / total_steps
-        progress = math.sin(angle)
-        
-        # Invert Z motion if requested
-        z_progress = -progress if invert_z else progress
-        z_offset = distance_mm * z_progress / 2.0
-        
-        new_pose = initial_pose.copy()
-        new_pose[2] = initial_pose[2] + z_offset
-        
-        # Yaw and pitch are NOT inverted - they stay synchronized
-        yaw_offset = 15.0 * progress
-        new_yaw = initial_pose[5] + yaw_offset
-        new_pose[5] = max(0.0, min(85.0, new_yaw))
-        
-        pitch_offset = 30.0 * progress
-        new_pitch = initial_pose[4] + pitch_offset
-        new_pose[4] = max(-85.0, min(85.0, new_pitch))
-        
-        # Ensure Z stays positive
-        new_pose[2] = max(50.0, new_pose[2])
+        pose1 = poses1[i]
+        pose2 = poses2[i]
         
-        # LED control - on when near top (based on original progress, not inverted)
-        if progress > 0.85:
-            robot.led_ctrl(25)  # 10% brightness
-        else:
-            robot.led_ctrl(0)
+        if leds[i] != led_state:
+            led_state = leds[i]
+            with lock1:
+                robot1.led_ctrl(led_state)
+            with lock2:
+                robot2.led_ctrl(led_state)
         
-        # Send command
-        robot.pose_ctrl(new_pose)
+        # Send both commands back-to-back
+        send1(pose1)
+        send2(pose2)
         
         # Progress logging (only log every second)
         if i % fps == 0:
-            print(f"  {robot_id} t={i/fps:.1f}s: z={new_pose[2]:.1f}mm, yaw={new_pose[5]:.1f}°, pitch={new_pose[4]:.1f}°")
+            print(f"  Robot 1 t={i/fps:.1f}s: z={pose1[2]:.1f}mm, yaw={pose1[5]:.1f}°, pitch={pose1[4]:.1f}°")
+            print(f"  Robot 2 t={i/fps:.1f}s: z={pose2[2]:.1f}mm, yaw={pose2[5]:.1f}°, pitch={pose2[4]:.1f}°")
         
-        time.sleep(dt)
+        slack = t0 + (i + 1) * dt - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+    
+    if async_writes:
+        writer1.close()
+        writer2.close()
     
-    # Turn off LED
-    robot.led_ctrl(0)
-    print(f"{robot_id} motion complete!")
+    # Turn off LEDs
+    robot1.led_ctrl(0)
+    robot2.led_ctrl(0)
+    print("Motion complete!")
 
 
 def main():
     # Parse arguments
-    port1 = sys.argv[1] if len(sys.argv) > 1 else "/dev/ttyUSB0"
-    port2 = sys.argv[2] if len(sys.argv) > 2 else "/dev/ttyUSB1"
-    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+    low_latency = "--low-latency" in sys.argv
+    async_writes = "--async-writes" in sys.argv
+    args = [a for a in sys.argv[1:] if a not in ("--low-latency", "--async-writes")]
+    port1 = args[0] if len(args) > 0 else "/dev/ttyUSB0"
+    port2 = args[1] if len(args) > 1 else "/dev/ttyUSB1"
+    duration = float(args[2]) if len(args) > 2 else 10.0
     
-    print(f"Usage: {sys.argv[0]} [port1] [port2] [duration_sec]")
+    print(f"Usage: {sys.argv[0]} [port1] [port2] [duration_sec] [--low-latency] [--async-writes]")
     print(f"Running with: port1={port1}, port2={port2}, duration={duration}s\n")
     
     print("=== Roarm DUAL Smooth Cartesian Motion Test ===\n")
     
+    if async_writes:
+        # RoarmWriter lives in lerobot_robot_roarm, whose __init__ needs lerobot;
+        # find out now rather than after the robots have started moving
+        try:
+            import lerobot_robot_roarm  # noqa: F401
+        except ImportError as e:
+            sys.exit(f"--async-writes requires lerobot_robot_roarm (and lerobot): {e}")
+    
+    if low_latency:
+        try:
+            from lerobot_robot_roarm.serial_utils import enable_low_latency, sdk_fileno
+        except ImportError as e:
+            sys.exit(f"--low-latency requires lerobot_robot_roarm (and lerobot): {e}")
+    
     # Connect to both robots
     print(f"Connecting to Robot 1 on {port1}...")
     robot1 = RoarmSDK(roarm_type='roarm_m3', port=port1)
@@ -101,6 +172,10 @@ def main():
     robot2 = RoarmSDK(roarm_type='roarm_m3', port=port2)
     time.sleep(0.5)
     
+    if low_latency:
+        enable_low_latency(port1, fd=sdk_fileno(robot1))
+        enable_low_latency(port2, fd=sdk_fileno(robot2))
+    
     try:
         # Get initial poses
         print("\nRobot 1 initial pose:")
@@ -138,29 +213,13 @@ def main():
         print(f"\nRobot 1 commanded z={start_pose1[2]:.1f}mm, actual z={actual1[2]:.1f}mm")
         print(f"Robot 2 commanded z={start_pose2[2]:.1f}mm, actual z={actual2[2]:.1f}mm")
         
-        # Create threads for simultaneous control
         print("\n=== Starting synchronized choreography ===\n")
         
         # Robot 1: normal Z motion
         # Robot 2: inverted Z motion (mirrored on vertical axis)
-        thread1 = threading.Thread(
-            target=smooth_dual_motion,
-            args=(robot1, "Robot 1", start_pose1, duration, 30, 3, False)
-        )
-        
-        thread2 = threading.Thread(
-            target=smooth_dual_motion,
-            args=(robot2, "Robot 2", start_pose2, duration, 30, 3, True)
-        )
-        
-        # Start both threads
         start_time = time.time()
-        thread1.start()
-        thread2.start()
-        
-        # Wait for both to complete
-        thread1.join()
-        thread2.join()
+        smooth_dual_motion(robot1, robot2, start_pose1, start_pose2, duration, 30, 3,
+                           async_writes=async_writes)
         
         elapsed = time.time() - start_time
         print(f"\n=== Choreography completed in {elapsed:.2f}s ===\n")
@@ -169,17 +228,8 @@ def main():
         final1 = robot1.pose_get()
         final2 = robot2.pose_get()
         
-        error1 = math.sqrt(
-            (final1[0] - start_pose1[0])**2 +
-            (final1[1] - start_pose1[1])**2 +
-            (final1[2] - start_pose1[2])**2
-        )
-        
-        error2 = math.sqrt(
-            (final2[0] - start_pose2[0])**2 +
-            (final2[1] - start_pose2[1])**2 +
-            (final2[2] - start_pose2[2])**2
-        )
+        error1 = float(np.linalg.norm(np.subtract(final1[:3], start_pose1[:3])))
+        error2 = float(np.linalg.norm(np.subtract(final2[:3], start_pose2[:3])))
         
         print(f"Robot 1 position error: {error1:.2f}mm")
         print(f"Robot 2 position error: {error2:.2f}mm")
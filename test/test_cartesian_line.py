@@ -20,16 +20,19 @@ Observed Accuracy:
 - Suitable for coarse positioning, not precision tasks
 
 Usage:
-    python test_cartesian_line.py [port] [distance_mm] [steps]
+    python test_cartesian_line.py [port] [distance_mm] [steps] [--low-latency]
     
 Example:
-    python test_cartesian_line.py /dev/ttyUSB0 50 10
+    python test_cartesian_line.py /dev/ttyUSB0 50 10 --low-latency
+
+--low-latency puts the USB-serial port in low-latency mode (1 ms instead of
+the 16 ms FTDI default); adapters that don't support it are left as-is.
 """
 import time
 from roarm_sdk import roarm as RoarmSDK
 
 
-def test_x_axis_line(port='/dev/ttyUSB0', distance_mm=50, steps=10, speed_mm_per_sec=20):
+def test_x_axis_line(port='/dev/ttyUSB0', distance_mm=50, steps=10, speed_mm_per_sec=20, low_latency=False):
     """
     Move the end-effector in a straight line along X-axis.
     
@@ -38,14 +41,25 @@ def test_x_axis_line(port='/dev/ttyUSB0', distance_mm=50, steps=10, speed_mm_per
         distance_mm: Total distance to move in mm
         steps: Number of steps for the movement
         speed_mm_per_sec: Movement speed
+        low_latency: Put the serial port in low-latency mode
     """
     print("=== Roarm Cartesian Line Test ===\n")
     
+    if low_latency:
+        # The only part of this test that needs more than roarm_sdk
+        try:
+            from lerobot_robot_roarm.serial_utils import enable_low_latency, sdk_fileno
+        except ImportError as e:
+            raise SystemExit(f"--low-latency requires lerobot_robot_roarm (and lerobot): {e}")
+    
     # Connect to robot
     print(f"Connecting to Roarm on {port}...")
     robot = RoarmSDK(roarm_type='roarm_m3', port=port)
     time.sleep(0.5)
     
+    if low_latency:
+        enable_low_latency(port, fd=sdk_fileno(robot))
+    
     try:
         # Get initial pose
         initial_pose = robot.pose_get()
@@ -81,16 +95,14 @@ def test_x_axis_line(port='/dev/ttyUSB0', distance_mm=50, steps=10, speed_mm_per
         print(f"Moving {distance_mm}mm along Z-axis in {steps} steps...")
         print(f"Step size: {step_size:.1f}mm, delay: {delay:.2f}s\n")
         
+        # One pose buffer for both ramps; only Z changes per step
+        new_pose = list(initial_pose)
+        
         # Move upward along Z-axis
         print("Upward movement:")
         for i in range(steps + 1):
-            # Create new pose with only Z changed
-            new_pose = initial_pose.copy()
-            new_pose[2] = initial_pose[2] + (i * step_size)
-            
             # Ensure Z is always positive (SDK requirement)
-            if new_pose[2] < 50.0:
-                new_pose[2] = 50.0
+            new_pose[2] = max(50.0, initial_pose[2] + (i * step_size))
             
             # Send pose command
             print(f"  Step {i}/{steps}: z={new_pose[2]:.1f}mm", end='')
@@ -107,12 +119,8 @@ def test_x_axis_line(port='/dev/ttyUSB0', distance_mm=50, steps=10, speed_mm_per
         # Move back down to initial position
         print("\nDownward movement (returning to start):")
         for i in range(steps, -1, -1):
-            new_pose = initial_pose.copy()
-            new_pose[2] = initial_pose[2] + (i * step_size)
-            
             # Ensure Z is always positive (SDK requirement)
-            if new_pose[2] < 50.0:
-                new_pose[2] = 50.0
+            new_pose[2] = max(50.0, initial_pose[2] + (i * step_size))
             
             print(f"  Step {steps-i}/{steps}: z={new_pose[2]:.1f}mm", end='')
             robot.pose_ctrl(new_pose)
@@ -156,11 +164,13 @@ if __name__ == "__main__":
     import sys
     
     # Parse command line arguments
-    port = sys.argv[1] if len(sys.argv) > 1 else '/dev/ttyUSB0'
-    distance = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
-    steps = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    low_latency = "--low-latency" in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--low-latency"]
+    port = args[0] if len(args) > 0 else '/dev/ttyUSB0'
+    distance = float(args[1]) if len(args) > 1 else 50.0
+    steps = int(args[2]) if len(args) > 2 else 10
     
-    print(f"Usage: {sys.argv[0]} [port] [distance_mm] [steps]")
+    print(f"Usage: {sys.argv[0]} [port] [distance_mm] [steps] [--low-latency]")
     print(f"Running with: port={port}, distance={distance}mm, steps={steps}\n")
     
-    test_x_axis_line(port=port, distance_mm=distance, steps=steps)
+    test_x_axis_line(port=port, distance_mm=distance, steps=steps, low_latency=low_latency)
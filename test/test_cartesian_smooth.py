@@ -12,7 +12,7 @@ SDK Validation Limits:
 - Orientation: roll ∈ [-90, 90]°, pitch/yaw ∈ [-180, 180]°
 
 Usage:
-    python test_cartesian_smooth.py [port] [trajectory] [duration_sec]
+    python test_cartesian_smooth.py [port] [trajectory] [duration] [--realtime]
     
 Trajectories:
     circle_xy   - Circular motion in XY plane
@@ -23,13 +23,223 @@ Trajectories:
     
 Example:
     python test_cartesian_smooth.py /dev/ttyUSB0 circle_xy 10
+
+Set ROARM_LOG=0 to skip the once-per-second progress lines.
+
+--realtime pins the control loop to one CPU and runs it under SCHED_FIFO
+(Linux; needs CAP_SYS_NICE or an rtprio limit). For the least jitter also
+keep that CPU free with isolcpus= on the kernel command line.
 """
 
+import argparse
+import os
+import queue
 import sys
+import threading
 import time
 import math
+import traceback
+from functools import partial
+import numpy as np
 from roarm_sdk import roarm as RoarmSDK
 
+LOG_PROGRESS = os.environ.get("ROARM_LOG", "1").strip().lower() not in ("0", "false", "off", "no", "")
+
+# Per-column pose bounds [x, y, z, roll, pitch, yaw]; Z stays above ground
+POSE_LO = np.array([-np.inf, -np.inf, 50.0, -np.inf, -np.inf, -np.inf])
+POSE_HI = np.full(6, np.inf)
+
+
+# Pose changes smaller than this (mm for x/y/z, degrees for roll/pitch/yaw)
+# are below the arm's repeatability and not worth a serial command
+POSE_EPS = np.array([0.5, 0.5, 0.5, 0.5, 0.5, 0.5])
+
+
+def clamp_poses(poses, lo=POSE_LO, hi=POSE_HI):
+    """Clamp an (N, 6) trajectory to per-column bounds in place, in one pass."""
+    return np.clip(poses, lo, hi, out=poses)
+
+
+def deadband_mask(poses, eps=POSE_EPS):
+    """
+    Which rows of an (N, 6) trajectory are worth sending.
+    
+    A row is sent when any column has moved more than eps since the last
+    row that was sent (not the previous row, so slow motion still goes out
+    once it adds up). The first and last rows are always sent.
+    """
+    # Each decision depends on the last row sent, so this can't be one
+    # vectorized diff; loop over plain floats instead of tiny numpy ops
+    rows = np.asarray(poses, dtype=np.float64).tolist()
+    eps = np.broadcast_to(eps, (6,)).tolist()
+    send = [False] * len(rows)
+    last = None
+    for i, row in enumerate(rows):
+        if last is None or any(abs(a - b) > e for a, b, e in zip(row, last, eps)):
+            send[i] = True
+            last = row
+    if send:
+        send[-1] = True
+    return send
+
+
+class PoseStreamer:
+    """
+    Stand-in for the robot that keeps serial I/O off the trajectory loop.
+    
+    pose_ctrl() hands the pose to a writer thread through a one-slot queue
+    (an unsent pose is replaced by the newer one) and returns immediately.
+    pose_get() returns the latest pose from a telemetry thread that polls
+    the robot at telemetry_hz. Both threads share one lock on the SDK;
+    serial reads and writes release the GIL, so threads are enough here.
+    SDK errors in either thread are printed and the thread carries on, like
+    lerobot_robot_roarm's RoarmWriter/SerialPump (not imported here so this
+    script keeps needing only roarm_sdk).
+    """
+    
+    def __init__(self, robot, telemetry_hz=5):
+        self.robot = robot
+        self.telemetry_hz = telemetry_hz
+        self.lock = threading.Lock()
+        self._slot = queue.Queue(maxsize=1)
+        self._latest_pose = None
+        self._running = False
+        self._threads = []
+    
+    def __enter__(self):
+        self._latest_pose = self.robot.pose_get()
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._write_loop, daemon=True),
+            threading.Thread(target=self._telemetry_loop, daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._slot.join()  # let the last pose go out
+        self._running = False
+        self._slot.put(None)
+        for t in self._threads:
+            t.join()
+    
+    def pose_ctrl(self, pose):
+        try:
+            self._slot.get_nowait()
+            self._slot.task_done()
+        except queue.Empty:
+            pass
+        self._slot.put_nowait(list(pose))
+    
+    def pose_get(self):
+        return self._latest_pose
+    
+    def led_ctrl(self, level):
+        with self.lock:
+            self.robot.led_ctrl(level)
+    
+    def _write_loop(self):
+        while True:
+            pose = self._slot.get()
+            try:
+                if pose is None:
+                    return
+                with self.lock:
+                    self.robot.pose_ctrl(pose)
+            except Exception as e:
+                print(f"  pose_ctrl failed: {e}", file=sys.stderr)
+            finally:
+                self._slot.task_done()
+    
+    def _telemetry_loop(self):
+        period = 1.0 / self.telemetry_hz
+        while self._running:
+            try:
+                with self.lock:
+                    pose = self.robot.pose_get()
+                if pose:
+                    self._latest_pose = pose
+            except Exception as e:
+                print(f"  pose_get failed: {e}", file=sys.stderr)
+            time.sleep(period)
+
+
+def pace(t0_ns, i, fps):
+    """
+    Wait for step i's deadline and return the step to run next.
+    
+    Step i is due at t0_ns + i/fps on the perf_counter_ns() clock, computed
+    in integer nanoseconds from t0_ns so rounding never accumulates. Sleeps
+    to within a millisecond of the deadline, then spins for the rest.
+    Deadlines are absolute, so slow steps don't accumulate drift; if a step
+    overran by whole periods the samples that are already late are dropped
+    and the trajectory stays on schedule.
+    """
+    now = time.perf_counter_ns()
+    i = max(i, int((now - t0_ns) * fps // 1_000_000_000))
+    deadline = t0_ns + int(i * 1_000_000_000 // fps)
+    remaining = deadline - now
+    if remaining > 2_000_000:
+        time.sleep((remaining - 1_000_000) / 1e9)
+    while time.perf_counter_ns() < deadline:
+        pass
+    return i
+
+
+def stream_trajectory(robot, trajectory, fps, report=None, leds=None):
+    """
+    Send a precomputed trajectory, one pose row per frame, at fps.
+    
+    The Roarm firmware takes one pose per command and has no queued
+    multi-pose message, so rows still go out one per frame; everything else
+    is prepared before the first one is sent. Rows within POSE_EPS of the
+    last one sent are skipped (the frame is still paced).
+    
+    Args:
+        robot: Robot (or PoseStreamer) to send to
+        trajectory: (N, 6) array of poses
+        fps: Frames per second
+        report: Called as report(i, pose, current_pose) once per second
+        leds: Optional LED level per frame (sent only when it changes)
+    """
+    poses = trajectory.tolist()
+    send = deadband_mask(trajectory)
+    total_steps = len(poses)
+    # Bound methods looked up once rather than on every frame
+    pose_ctrl = robot.pose_ctrl
+    led_ctrl = robot.led_ctrl
+    log = LOG_PROGRESS and report is not None
+    # LED commands only go out when the level changes; -1 forces the first one
+    last_led = -1
+    
+    t0_ns = time.perf_counter_ns()
+    i = 0
+    while i < total_steps:
+        pose = poses[i]
+        if leds is not None and leds[i] != last_led:
+            last_led = leds[i]
+            led_ctrl(last_led)
+        if send[i]:
+            pose_ctrl(pose)
+        
+        # Progress indicator
+        if log and i % fps == 0:
+            report(i, pose, robot.pose_get())
+        
+        i = pace(t0_ns, i + 1, fps)
+
+
+def circle_points(radius_mm, total_steps):
+    """
+    Offsets of total_steps evenly spaced points on a circle, as complex x + iy.
+
+    One complex exp gives cos and sin of each angle together, instead of
+    separate np.cos and np.sin passes over the same angles.
+    """
+    angles = np.linspace(0, 2 * np.pi, total_steps, endpoint=False)
+    return radius_mm * np.exp(1j * angles)
+
 
 def smooth_circle_xy(robot, initial_pose, radius_mm=30, duration_sec=10, fps=20):
     """Move in smooth circle in XY plane."""
@@ -40,27 +250,18 @@ def smooth_circle_xy(robot, initial_pose, radius_mm=30, duration_sec=10, fps=20)
     center_y = initial_pose[1]
     
     total_steps = int(duration_sec * fps)
-    dt = 1.0 / fps
     
-    for i in range(total_steps):
-        # Calculate angle (full circle in duration_sec)
-        angle = 2 * math.pi * i / total_steps
-        
-        # Calculate position on circle
-        new_pose = initial_pose.copy()
-        new_pose[0] = center_x + radius_mm * math.cos(angle)
-        new_pose[1] = center_y + radius_mm * math.sin(angle)
-        
-        # Send command
-        robot.pose_ctrl(new_pose)
-        
-        # Progress indicator
-        if i % fps == 0:
-            current = robot.pose_get()
-            print(f"  t={i/fps:.1f}s: target=[{new_pose[0]:.1f}, {new_pose[1]:.1f}], "
-                  f"actual=[{current[0]:.1f}, {current[1]:.1f}]")
-        
-        time.sleep(dt)
+    # Points on the circle (full circle in duration_sec), computed up front
+    z = circle_points(radius_mm, total_steps)
+    trajectory = np.tile(np.asarray(initial_pose, dtype=np.float64), (total_steps, 1))
+    trajectory[:, 0] = center_x + z.real
+    trajectory[:, 1] = center_y + z.imag
+    
+    def report(i, pose, current):
+        print(f"  t={i/fps:.1f}s: target=[{pose[0]:.1f}, {pose[1]:.1f}], "
+              f"actual=[{current[0]:.1f}, {current[1]:.1f}]")
+    
+    stream_trajectory(robot, trajectory, fps, report)
 
 
 def smooth_circle_xz(robot, initial_pose, radius_mm=30, duration_sec=10, fps=20):
@@ -77,27 +278,79 @@ def smooth_circle_xz(robot, initial_pose, radius_mm=30, duration_sec=10, fps=20)
         print(f"  Adjusted center Z to {center_z}mm to stay above ground\n")
     
     total_steps = int(duration_sec * fps)
-    dt = 1.0 / fps
     
+    z = circle_points(radius_mm, total_steps)
+    trajectory = np.tile(np.asarray(initial_pose, dtype=np.float64), (total_steps, 1))
+    trajectory[:, 0] = center_x + z.real
+    trajectory[:, 2] = center_z + z.imag
+    clamp_poses(trajectory)
+    
+    def report(i, pose, current):
+        print(f"  t={i/fps:.1f}s: target=[{pose[0]:.1f}, {pose[2]:.1f}], "
+              f"actual=[{current[0]:.1f}, {current[2]:.1f}]")
+    
+    stream_trajectory(robot, trajectory, fps, report)
+
+
+def _fill_line(out, progress, init_pose, axis, distance_mm, cycles, rotate, tilt):
+    """Raw (unclamped) build_line_traj poses as one scalar loop, for numba."""
+    total_steps = out.shape[0]
+    w = 2.0 * math.pi * cycles / total_steps
     for i in range(total_steps):
-        angle = 2 * math.pi * i / total_steps
-        
-        new_pose = initial_pose.copy()
-        new_pose[0] = center_x + radius_mm * math.cos(angle)
-        new_pose[2] = center_z + radius_mm * math.sin(angle)
-        
-        # Clamp Z
-        if new_pose[2] < 50.0:
-            new_pose[2] = 50.0
-        
-        robot.pose_ctrl(new_pose)
-        
-        if i % fps == 0:
-            current = robot.pose_get()
-            print(f"  t={i/fps:.1f}s: target=[{new_pose[0]:.1f}, {new_pose[2]:.1f}], "
-                  f"actual=[{current[0]:.1f}, {current[2]:.1f}]")
+        p = math.sin(w * i)
+        progress[i] = p
+        for k in range(6):
+            out[i, k] = init_pose[k]
+        out[i, axis] += distance_mm * p / 2.0
+        if rotate:
+            out[i, 5] += 15.0 * p
+        if tilt:
+            out[i, 4] += 30.0 * p
+
+
+# For long or high-fps trajectories numba (optional: pip install numba)
+# compiles the loop above; cache=True keeps the compiled kernel on disk
+try:
+    from numba import njit
+    _fill_line_jit = njit(cache=True, fastmath=True)(_fill_line)
+except ImportError:
+    _fill_line_jit = None
+
+
+def build_line_traj(initial_pose, axis, distance_mm, total_steps, cycles, rotate, tilt):
+    """
+    Poses for a sinusoidal line along one axis, one row per step.
+    
+    Returns:
+        (trajectory, progress): (N, 6) pose array and the sine phase in [-1, 1]
+    """
+    if _fill_line_jit is not None:
+        poses = np.empty((total_steps, 6))
+        progress = np.empty(total_steps)
+        _fill_line_jit(poses, progress, np.asarray(initial_pose, dtype=np.float64), axis,
+                       float(distance_mm), float(cycles), rotate, tilt)
+    else:
+        # Smooth sinusoidal motion (multiple cycles)
+        progress = np.sin(2 * np.pi * cycles * np.arange(total_steps) / total_steps)
         
-        time.sleep(dt)
+        poses = np.tile(np.asarray(initial_pose, dtype=np.float64), (total_steps, 1))
+        poses[:, axis] += distance_mm * progress / 2.0
+        # Yaw oscillates with the motion (small range), pitch tilts with it
+        if rotate:
+            poses[:, 5] += 15.0 * progress
+        if tilt:
+            poses[:, 4] += 30.0 * progress
+    
+    lo, hi = POSE_LO.copy(), POSE_HI.copy()
+    # Yaw kept to a safe 0-85°, pitch inside the SDK's ±90°
+    if rotate:
+        lo[5], hi[5] = 0.0, 85.0
+    if tilt:
+        lo[4], hi[4] = -85.0, 85.0
+    
+    # All clamps (including Z above ground) in one pass, for either path
+    clamp_poses(poses, lo, hi)
+    return poses, progress
 
 
 def smooth_line(robot, initial_pose, axis, distance_mm=50, duration_sec=10, fps=20, cycles=1, rotate_with_motion=False, tilt_with_motion=False, led_at_top=False):
@@ -117,72 +370,59 @@ def smooth_line(robot, initial_pose, axis, distance_mm=50, duration_sec=10, fps=
         print()
     
     total_steps = int(duration_sec * fps)
-    dt = 1.0 / fps
+    trajectory, progress = build_line_traj(initial_pose, axis, distance_mm, total_steps, cycles,
+                                           rotate_with_motion, tilt_with_motion)
     
-    for i in range(total_steps):
-        # Smooth sinusoidal motion (multiple cycles)
-        progress = math.sin(2 * math.pi * cycles * i / total_steps)
-        offset = distance_mm * progress / 2.0
-        
-        new_pose = initial_pose.copy()
-        new_pose[axis] = initial_pose[axis] + offset
-        
-        # If rotating with motion, modulate yaw angle
-        if rotate_with_motion:
-            # Yaw oscillates (rotation around Z-axis)
-            # Keep within SDK limits: typically 0-90° for yaw
-            yaw_offset = 15.0 * progress  # Small range to stay safe
-            new_yaw = initial_pose[5] + yaw_offset
-            # Clamp to safe range
-            new_pose[5] = max(0.0, min(85.0, new_yaw))
-        
-        # If tilting with motion, modulate pitch angle
-        if tilt_with_motion:
-            # Pitch oscillates (tilt up/down)
-            # SDK limits: -90 to +90° for pitch
-            pitch_offset = 30.0 * progress  # Larger range for dramatic tilt
-            new_pitch = initial_pose[4] + pitch_offset
-            # Clamp to safe range
-            new_pose[4] = max(-85.0, min(85.0, new_pitch))
-        
-        # Ensure Z stays positive
-        if axis == 2 or new_pose[2] < 50.0:
-            new_pose[2] = max(50.0, new_pose[2])
-        
-        # Control LED based on position (only for Z-axis movements)
-        if led_at_top and axis == 2:
-            # Turn on LED when near top (progress > 0.85), very dim
-            if progress > 0.85:
-                robot.led_ctrl(25)  # 10% brightness when at top
-            else:
-                robot.led_ctrl(0)   # Off when not at top
-        
-        robot.pose_ctrl(new_pose)
-        
-        if i % fps == 0:
-            current = robot.pose_get()
-            if rotate_with_motion and tilt_with_motion:
-                print(f"  t={i/fps:.1f}s: z={new_pose[axis]:.1f}mm, yaw={new_pose[5]:.1f}°, pitch={new_pose[4]:.1f}°")
-            elif rotate_with_motion:
-                print(f"  t={i/fps:.1f}s: target={new_pose[axis]:.1f}mm, yaw={new_pose[5]:.1f}°, "
-                      f"actual={current[axis]:.1f}mm, yaw={current[5]:.1f}°")
-            elif tilt_with_motion:
-                print(f"  t={i/fps:.1f}s: target={new_pose[axis]:.1f}mm, pitch={new_pose[4]:.1f}°, "
-                      f"actual={current[axis]:.1f}mm, pitch={current[4]:.1f}°")
-            else:
-                print(f"  t={i/fps:.1f}s: target={new_pose[axis]:.1f}mm, "
-                      f"actual={current[axis]:.1f}mm, error={abs(current[axis]-new_pose[axis]):.1f}mm")
-        
-        time.sleep(dt)
+    # Control LED based on position (only for Z-axis movements):
+    # on when near top (progress > 0.85), very dim
+    leds = None
+    if led_at_top and axis == 2:
+        leds = np.where(progress > 0.85, 25, 0).tolist()  # 10% brightness when at top
+    
+    def report(i, pose, current):
+        if rotate_with_motion and tilt_with_motion:
+            print(f"  t={i/fps:.1f}s: z={pose[axis]:.1f}mm, yaw={pose[5]:.1f}°, pitch={pose[4]:.1f}°")
+        elif rotate_with_motion:
+            print(f"  t={i/fps:.1f}s: target={pose[axis]:.1f}mm, yaw={pose[5]:.1f}°, "
+                  f"actual={current[axis]:.1f}mm, yaw={current[5]:.1f}°")
+        elif tilt_with_motion:
+            print(f"  t={i/fps:.1f}s: target={pose[axis]:.1f}mm, pitch={pose[4]:.1f}°, "
+                  f"actual={current[axis]:.1f}mm, pitch={current[4]:.1f}°")
+        else:
+            print(f"  t={i/fps:.1f}s: target={pose[axis]:.1f}mm, "
+                  f"actual={current[axis]:.1f}mm, error={abs(current[axis]-pose[axis]):.1f}mm")
+    
+    stream_trajectory(robot, trajectory, fps, report, leds)
+
+
+# Trajectory name -> callable(robot, initial_pose, duration_sec=...)
+TRAJECTORIES = {
+    "circle_xy": partial(smooth_circle_xy, radius_mm=30, fps=20),
+    "circle_xz": partial(smooth_circle_xz, radius_mm=30, fps=20),
+    "line_x": partial(smooth_line, axis=0, distance_mm=150, fps=30, cycles=3),
+    "line_y": partial(smooth_line, axis=1, distance_mm=150, fps=30, cycles=3),
+    "line_z": partial(smooth_line, axis=2, distance_mm=240, fps=30, cycles=3,
+                      rotate_with_motion=True, tilt_with_motion=True, led_at_top=True),
+}
 
 
 def main():
-    # Parse arguments
-    port = sys.argv[1] if len(sys.argv) > 1 else "/dev/ttyUSB0"
-    trajectory = sys.argv[2] if len(sys.argv) > 2 else "circle_xy"
-    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+    parser = argparse.ArgumentParser(description="Stream smooth Cartesian trajectories to a Roarm.")
+    parser.add_argument("port", nargs="?", default="/dev/ttyUSB0")
+    parser.add_argument("trajectory", nargs="?", default="circle_xy", choices=TRAJECTORIES)
+    parser.add_argument("duration", nargs="?", type=float, default=10.0, help="seconds")
+    parser.add_argument("--realtime", action="store_true",
+                        help="pin the control loop to one CPU and run it under SCHED_FIFO")
+    args = parser.parse_args()
+    port, trajectory, duration = args.port, args.trajectory, args.duration
+    
+    if args.realtime:
+        # The only part of this script that needs more than roarm_sdk
+        try:
+            from lerobot_robot_roarm.timing import make_current_thread_realtime
+        except ImportError as e:
+            parser.error(f"--realtime requires lerobot_robot_roarm (and lerobot): {e}")
     
-    print(f"Usage: {sys.argv[0]} [port] [trajectory] [duration_sec]")
     print(f"Running with: port={port}, trajectory={trajectory}, duration={duration}s\n")
     
     print("=== Roarm Smooth Cartesian Motion Test ===\n")
@@ -220,23 +460,16 @@ def main():
         initial_pose[4] = max(-85.0, min(85.0, initial_pose[4]))
         initial_pose[5] = max(-85.0, min(85.0, initial_pose[5]))
         
-        # Execute trajectory
+        # Execute trajectory; serial traffic runs on the streamer's threads
         start_time = time.time()
-        
-        if trajectory == "circle_xy":
-            smooth_circle_xy(robot, initial_pose, radius_mm=30, duration_sec=duration, fps=20)
-        elif trajectory == "circle_xz":
-            smooth_circle_xz(robot, initial_pose, radius_mm=30, duration_sec=duration, fps=20)
-        elif trajectory == "line_x":
-            smooth_line(robot, initial_pose, axis=0, distance_mm=150, duration_sec=duration, fps=30, cycles=3, rotate_with_motion=False, tilt_with_motion=False, led_at_top=False)
-        elif trajectory == "line_y":
-            smooth_line(robot, initial_pose, axis=1, distance_mm=150, duration_sec=duration, fps=30, cycles=3, rotate_with_motion=False, tilt_with_motion=False, led_at_top=False)
-        elif trajectory == "line_z":
-            smooth_line(robot, initial_pose, axis=2, distance_mm=240, duration_sec=duration, fps=30, cycles=3, rotate_with_motion=True, tilt_with_motion=True, led_at_top=True)
-        else:
-            print(f"Unknown trajectory: {trajectory}")
-            print("Available: circle_xy, circle_xz, line_x, line_y, line_z")
-            return
+        with PoseStreamer(robot) as streamer:
+            if args.realtime and hasattr(os, "sched_getaffinity"):
+                # Only this thread, and only once the streamer's threads are
+                # running: they would inherit the pinning and SCHED_FIFO and
+                # then stall behind pace()'s spin on the same CPU. Highest-
+                # numbered CPU we may run on (isolated cores usually sit there).
+                make_current_thread_realtime({max(os.sched_getaffinity(0))})
+            TRAJECTORIES[trajectory](streamer, initial_pose, duration_sec=duration)
         
         elapsed = time.time() - start_time
         print(f"\nTrajectory completed in {elapsed:.2f}s")
@@ -266,7 +499,6 @@ def main():
         
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
         traceback.print_exc()
     
     print("\n=== Test Complete ===")
@@ -48,31 +48,38 @@ def circular_table_motion(robot, center_x, center_y, z_height, radius, duration_
     # LED on for motion
     robot.led_ctrl(1)
     
+    # Pose buffer: [x, y, z, roll, pitch, yaw]; only x and y change per step
+    pose = [
+        center_x,   # X position
+        center_y,   # Y position
+        z_height,   # Z height (constant)
+        90.0,       # Roll (gripper pointing down)
+        0.0,        # Pitch
+        0.0         # Yaw
+    ]
+    
+    # Step around the circle (full circle over duration) by rotating
+    # (cos, sin) with loop-invariant factors instead of calling trig per step
+    dtheta = 2 * np.pi / total_steps
+    cd, sd = float(np.cos(dtheta)), float(np.sin(dtheta))
+    c, s = 1.0, 0.0
+    pose_ctrl = robot.pose_ctrl
+    
     for i in range(total_steps):
-        # Calculate angle (full circle over duration)
-        angle = 2 * np.pi * (i / total_steps)
-        
         # Calculate position on circle
-        x = center_x + radius * np.cos(angle)
-        y = center_y + radius * np.sin(angle)
-        
-        # Create pose: [x, y, z, roll, pitch, yaw]
-        pose = [
-            x,          # X position
-            y,          # Y position
-            z_height,   # Z height (constant)
-            90.0,       # Roll (gripper pointing down)
-            0.0,        # Pitch
-            0.0         # Yaw
-        ]
+        x = center_x + radius * c
+        y = center_y + radius * s
+        c, s = c * cd - s * sd, s * cd + c * sd
+        pose[0] = x
+        pose[1] = y
         
         # Send command
-        robot.pose_ctrl(pose)
+        pose_ctrl(pose)
         
         # Log progress every second
         if i % fps == 0:
             progress = (i / total_steps) * 100
-            angle_deg = np.degrees(angle)
+            angle_deg = 360.0 * i / total_steps
             print(f"  t={i/fps:.1f}s ({progress:.0f}%): x={x:.1f}, y={y:.1f}, angle={angle_deg:.0f}°")
         
         time.sleep(dt)
@@ -16,21 +16,45 @@ from roarm_sdk import roarm as RoarmSDK
 from threading import Thread
 
 
-def circular_table_motion(robot, robot_id, center_x, center_y, z_height, radius, duration_sec=20, fps=30):
+def circle_trajectory(center_x, center_y, z_height, radius, total_steps):
     """
-    Execute smooth circular motion on table surface.
+    Poses for one full circle on the table surface, one row per step.
     
     Args:
-        robot: RoarmSDK instance
-        robot_id: Robot identifier for logging
         center_x: Circle center X coordinate (mm)
         center_y: Circle center Y coordinate (mm)
         z_height: Constant Z height (mm)
         radius: Circle radius (mm)
-        duration_sec: Duration of motion (seconds)
+        total_steps: Number of poses
+    
+    Returns:
+        List of [x, y, z, roll, pitch, yaw] poses
+    """
+    angles = np.linspace(0, 2 * np.pi, total_steps, endpoint=False)
+    poses = np.empty((total_steps, 6))
+    poses[:, 0] = center_x + radius * np.cos(angles)  # X position
+    poses[:, 1] = center_y + radius * np.sin(angles)  # Y position
+    poses[:, 2] = z_height                            # Z height (constant)
+    poses[:, 3] = 90.0                                # Roll (gripper pointing down)
+    poses[:, 4:] = 0.0                                # Pitch, yaw
+    return poses.tolist()
+
+
+def circular_table_motion(robot, robot_id, poses, t0, fps=30):
+    """
+    Execute smooth circular motion on table surface.
+    
+    Both robots read the same precomputed pose list and pace against the
+    same start time, so they stay in step without copying the trajectory.
+    
+    Args:
+        robot: RoarmSDK instance
+        robot_id: Robot identifier for logging
+        poses: Shared poses from circle_trajectory (read-only)
+        t0: Shared time.monotonic() start; step i is due at t0 + i/fps
         fps: Control frequency (Hz)
     """
-    total_steps = int(duration_sec * fps)
+    total_steps = len(poses)
     dt = 1.0 / fps
     
     print(f"[{robot_id}] 🔵 Starting circular motion")
@@ -38,34 +62,21 @@ def circular_table_motion(robot, robot_id, center_x, center_y, z_height, radius,
     # LED on for motion
     robot.led_ctrl(1)
     
-    for i in range(total_steps):
-        # Calculate angle (full circle over duration)
-        angle = 2 * np.pi * (i / total_steps)
-        
-        # Calculate position on circle
-        x = center_x + radius * np.cos(angle)
-        y = center_y + radius * np.sin(angle)
-        
-        # Create pose: [x, y, z, roll, pitch, yaw]
-        pose = [
-            x,          # X position
-            y,          # Y position
-            z_height,   # Z height (constant)
-            90.0,       # Roll (gripper pointing down)
-            0.0,        # Pitch
-            0.0         # Yaw
-        ]
-        
+    pose_ctrl = robot.pose_ctrl
+    
+    for i, pose in enumerate(poses):
         # Send command
-        robot.pose_ctrl(pose)
+        pose_ctrl(pose)
         
         # Log progress every 2 seconds
         if i % (fps * 2) == 0:
             progress = (i / total_steps) * 100
-            angle_deg = np.degrees(angle)
-            print(f"[{robot_id}] t={i/fps:.1f}s ({progress:.0f}%): x={x:.1f}, y={y:.1f}, angle={angle_deg:.0f}°")
+            angle_deg = 360.0 * i / total_steps
+            print(f"[{robot_id}] t={i/fps:.1f}s ({progress:.0f}%): x={pose[0]:.1f}, y={pose[1]:.1f}, angle={angle_deg:.0f}°")
         
-        time.sleep(dt)
+        slack = t0 + (i + 1) * dt - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
     
     # LED off
     robot.led_ctrl(0)
@@ -143,14 +154,19 @@ def main():
         
         print("\n🚀 Starting synchronized circular motion...\n")
         
+        # One trajectory for both robots, computed once
+        fps = 30
+        poses = circle_trajectory(center_x, center_y, z_height, radius, int(duration * fps))
+        t0 = time.monotonic()
+        
         # Create threads for both robots
         thread1 = Thread(
             target=circular_table_motion,
-            args=(robot1, "Robot 1", center_x, center_y, z_height, radius, duration, 30)
+            args=(robot1, "Robot 1", poses, t0, fps)
         )
         thread2 = Thread(
             target=circular_table_motion,
-            args=(robot2, "Robot 2", center_x, center_y, z_height, radius, duration, 30)
+            args=(robot2, "Robot 2", poses, t0, fps)
         )
         
         # Start both threads
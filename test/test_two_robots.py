@@ -2,49 +2,58 @@
 """
 Quick test to verify we can connect to both Roarm robots.
 """
+from concurrent.futures import ThreadPoolExecutor
+
 from lerobot_robot_roarm import RoarmConfig, Roarm
 
+
+def _make(config):
+    robot = Roarm(config)
+    robot.connect(calibrate=False)
+    return robot
+
+
+def print_joints(name, obs):
+    print(f"{name} joints:")
+    for key, value in obs.items():
+        if ".pos" in key:
+            print(f"  {key}: {value:.3f}")
+
+
 print("Testing connection to both robots...\n")
 
-# Leader robot (ttyUSB0) - disable cameras for this test
-print("1. Connecting to Leader (ttyUSB0)...")
+# Leader (ttyUSB0) and follower (ttyUSB1) - cameras disabled for this test
 leader_config = RoarmConfig(
     roarm_type="roarm_m3",
     port="/dev/ttyUSB0",
     cameras={},  # Disable cameras for teleoperation test
 )
-leader = Roarm(leader_config)
-leader.connect(calibrate=False)
-print("✓ Leader connected")
-
-# Get leader position
-leader_obs = leader.get_observation()
-print("Leader joints:")
-for key, value in leader_obs.items():
-    if ".pos" in key:
-        print(f"  {key}: {value:.3f}")
-
-# Follower robot (ttyUSB1) - disable cameras for this test
-print("\n2. Connecting to Follower (ttyUSB1)...")
 follower_config = RoarmConfig(
     roarm_type="roarm_m3",
     port="/dev/ttyUSB1",
     cameras={},  # Disable cameras for teleoperation test
 )
-follower = Roarm(follower_config)
-follower.connect(calibrate=False)
-print("✓ Follower connected")
-
-# Get follower position
-follower_obs = follower.get_observation()
-print("Follower joints:")
-for key, value in follower_obs.items():
-    if ".pos" in key:
-        print(f"  {key}: {value:.3f}")
-
-print("\n✓ Both robots connected successfully!")
-
-# Cleanup
-leader.disconnect()
-follower.disconnect()
-print("✓ Disconnected")
+
+# Each robot sits on its own serial port, so the handshakes, reads and
+# disconnects can all wait in parallel
+with ThreadPoolExecutor(max_workers=2) as ex:
+    print("Connecting to Leader (ttyUSB0) and Follower (ttyUSB1)...")
+    leader_f = ex.submit(_make, leader_config)
+    follower_f = ex.submit(_make, follower_config)
+    leader = leader_f.result()
+    print("✓ Leader connected")
+    follower = follower_f.result()
+    print("✓ Follower connected\n")
+
+    # Get both positions
+    leader_obs_f = ex.submit(leader.get_observation)
+    follower_obs_f = ex.submit(follower.get_observation)
+    print_joints("Leader", leader_obs_f.result())
+    print_joints("Follower", follower_obs_f.result())
+
+    print("\n✓ Both robots connected successfully!")
+
+    # Cleanup
+    for f in [ex.submit(leader.disconnect), ex.submit(follower.disconnect)]:
+        f.result()
+    print("✓ Disconnected")
@@ -0,0 +1,101 @@
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("lerobot")
+pytest.importorskip("roarm_sdk")
+
+from lerobot_robot_roarm import daemon
+from lerobot_robot_roarm.daemon import RoarmDaemonClient
+
+
+class FakeSDK:
+    """Reports fixed angles and records every command it receives."""
+
+    def __init__(self):
+        self.angles = [10.0, 20.0, 30.0, 40.0, 50.0, 45.0]
+        self.calls = []
+
+    def joints_angle_get(self):
+        return list(self.angles)
+
+    def gripper_angle_get(self):
+        return None
+
+    def joints_angle_ctrl(self, angles, speed, acc):
+        self.calls.append(("joints", list(angles), speed, acc))
+
+    def gripper_angle_ctrl(self, angle, speed, acc):
+        raise OSError("gripper stalled")
+
+    def torque_set(self, cmd):
+        self.calls.append(("torque", cmd))
+
+
+def start_daemon(sdk, path):
+    """Serve ``sdk`` on ``path`` in the background and return a connected client."""
+    threading.Thread(target=daemon.serve, args=(sdk, path), daemon=True).start()
+    client = RoarmDaemonClient(path)
+    deadline = time.monotonic() + 1.0
+    while True:
+        try:
+            client.connect()
+            return client
+        except OSError:
+            assert time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "roarm.sock")
+
+
+@pytest.fixture
+def client(socket_path):
+    sdk = FakeSDK()
+    client = start_daemon(sdk, socket_path)
+    client.sdk = sdk
+    yield client
+    client.disconnect()
+
+
+def test_round_trip(client):
+    assert client.joints_angle_get() == client.sdk.angles
+    assert client.gripper_angle_get() is None
+
+    client.joints_angle_ctrl([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], speed=1000, acc=50)
+    client.torque_set(cmd=0)
+    assert client.sdk.calls == [
+        ("joints", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], 1000, 50),
+        ("torque", 0),
+    ]
+
+
+def test_sdk_error_is_reported_and_connection_survives(client):
+    with pytest.raises(RuntimeError, match="failed"):
+        client.gripper_angle_ctrl(30.0, speed=1000, acc=50)
+    assert client.joints_angle_get() == client.sdk.angles
+
+
+def test_socket_is_owner_only(client, socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_refuses_to_replace_running_daemon(client, socket_path):
+    with pytest.raises(RuntimeError, match="already running"):
+        daemon.serve(FakeSDK(), socket_path)
+    assert client.joints_angle_get() == client.sdk.angles
+
+
+def test_replaces_stale_socket_file(socket_path):
+    open(socket_path, "w").close()
+
+    client = start_daemon(FakeSDK(), socket_path)
+    try:
+        assert client.joints_angle_get() == FakeSDK().angles
+    finally:
+        client.disconnect()
@@ -0,0 +1,147 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("lerobot")
+
+from lerobot_robot_roarm import processors
+from lerobot_robot_roarm.processors import (
+    RoarmActionSafety,
+    RoarmFusedActionStep,
+    RoarmGripperNormalizer,
+    RoarmJointNormalizer,
+)
+
+JOINTS = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll"]
+
+
+class Transition:
+    def __init__(self, action):
+        self.action = action
+
+
+def chained(joint_names, gripper_name="gripper"):
+    return [
+        RoarmJointNormalizer(joint_names=joint_names),
+        RoarmGripperNormalizer(gripper_name=gripper_name),
+        RoarmActionSafety(joint_names=joint_names, gripper_name=gripper_name),
+    ]
+
+
+def run(steps, action):
+    transition = Transition(dict(action))
+    for step in steps:
+        transition = step.forward(transition)
+    return transition.action
+
+
+def assert_same(a, b):
+    assert a.keys() == b.keys()
+    for key in a:
+        assert a[key] == pytest.approx(b[key], abs=1e-12), key
+
+
+# Each case is a sequence of actions sent to the same step: the first one
+# meets NaN _last_pos, later ones are clamped against it
+CASES = {
+    "full": [
+        {**{f"{j}.pos": 0.1 * i for i, j in enumerate(JOINTS)}, "gripper.pos": 0.5},
+        {**{f"{j}.pos": 0.1 * i + 0.01 for i, j in enumerate(JOINTS)}, "gripper.pos": 0.6},
+    ],
+    "partial": [
+        {"shoulder_pan.pos": 0.2},
+        {"shoulder_pan.pos": 0.3, "elbow_flex.pos": -1.0},
+        {"gripper.pos": 1.0},
+        {"elbow_flex.pos": -0.9, "gripper.pos": 1.2},
+    ],
+    "clipped": [
+        {"shoulder_pan.pos": 0.0, "wrist_roll.pos": 0.0, "gripper.pos": 0.0},
+        {"shoulder_pan.pos": math.pi, "wrist_roll.pos": -math.pi, "gripper.pos": math.pi / 2},
+        {"shoulder_pan.pos": -math.pi, "wrist_roll.pos": math.pi, "gripper.pos": 0.0},
+    ],
+    "gripper_bounds": [
+        {"gripper.pos": 0.0},
+        {"gripper.pos": math.pi / 2},
+        {"gripper.pos": -0.5},
+        {"gripper.pos": 2.0},
+    ],
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_fused_step_matches_chain(case):
+    fused = [RoarmFusedActionStep(joint_names=JOINTS)]
+    chain = chained(JOINTS)
+    for action in CASES[case]:
+        assert_same(run(fused, action), run(chain, action))
+
+
+def test_fused_step_matches_chain_with_gripper_joint():
+    joints = JOINTS + ["gripper"]
+    fused = [RoarmFusedActionStep(joint_names=joints)]
+    chain = chained(joints)
+    for action in CASES["partial"] + CASES["gripper_bounds"]:
+        assert_same(run(fused, action), run(chain, action))
+
+
+def test_fused_step_starts_unclamped():
+    step = RoarmFusedActionStep(joint_names=JOINTS)
+    assert np.isnan(step._last_pos).all()
+
+    out = run([step], {"shoulder_pan.pos": math.pi})
+    assert out["shoulder_pan.pos"] == pytest.approx(1.0)
+
+
+def test_safety_last_positions_and_reset():
+    step = RoarmActionSafety(joint_names=JOINTS)
+    assert step.last_positions == {}
+
+    run([step], {"shoulder_pan.pos": 0.5})
+    assert step.last_positions == {"shoulder_pan.pos": 0.5}
+
+    step.last_positions = {"shoulder_pan.pos": 0.0}
+    out = run([step], {"shoulder_pan.pos": 1.0})
+    assert out["shoulder_pan.pos"] == pytest.approx(0.3)  # 3 rad/s * 0.1 s
+
+    step.reset()
+    assert step.last_positions == {}
+    out = run([step], {"shoulder_pan.pos": 1.0})
+    assert out["shoulder_pan.pos"] == pytest.approx(1.0)
+
+
+def test_fused_step_ignores_unknown_keys():
+    action = {"shoulder_pan.pos": 0.0, "ee.gripper_pos": 42.0}
+    assert_same(run([RoarmFusedActionStep(joint_names=JOINTS)], action), run(chained(JOINTS), action))
+
+
+def _numba_kernel():
+    pytest.importorskip("numba")
+    return processors._fused_step
+
+
+KERNELS = {
+    "loop": lambda: processors._fused_step_loop,
+    "numba": _numba_kernel,
+}
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_fused_kernel_matches_numpy(kernel):
+    step = KERNELS[kernel]()
+    rng = np.random.default_rng(0)
+    n = 6
+    scale = rng.uniform(0.1, 2.0, n)
+    offset = rng.uniform(-1.0, 1.0, n)
+    max_delta = np.full(n, 0.3)
+    last_ref = np.full(n, np.nan)
+    last = last_ref.copy()
+
+    # Subsets of slots (partial actions) with steps large enough to clip
+    for idx in ([0, 2], [0, 1, 2, 3, 4, 5], [5], [1, 3, 5], [0, 1, 2, 3, 4, 5]):
+        idx = np.array(idx, dtype=np.intp)
+        values = rng.uniform(-3.0, 3.0, len(idx))
+        expected = processors._fused_step_numpy(values, idx, scale, offset, max_delta, last_ref)
+        got = step(values, idx, scale, offset, max_delta, last)
+        np.testing.assert_allclose(got, expected, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(last, last_ref, rtol=0, atol=1e-12)
@@ -0,0 +1,85 @@
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("lerobot")
+pytest.importorskip("roarm_sdk")
+
+from lerobot_robot_roarm import RoarmConfig, roarm as roarm_module
+from lerobot_robot_roarm.roarm import Roarm
+
+
+class FakeSDK:
+    """Records joint commands and reports fixed angles (SDK order, degrees)."""
+
+    def __init__(self, **kwargs):
+        self.angles = [10.0, 20.0, 30.0, 40.0, 50.0, 45.0]
+        self.sent = []
+
+    def joints_angle_get(self):
+        # Like the SDK, a failed read comes back as -1
+        return list(self.angles) if self.angles != -1 else -1
+
+    def joints_angle_ctrl(self, angles, speed, acc):
+        self.sent.append(list(angles))
+
+    def gripper_angle_get(self):
+        return self.angles[5] if self.angles != -1 else -1
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+
+@pytest.fixture
+def robot(monkeypatch):
+    monkeypatch.setattr(roarm_module, "RoarmSDK", FakeSDK)
+    robot = Roarm(RoarmConfig(port="/dev/ttyUSB0", cameras={}))
+    robot._is_connected = True
+    return robot
+
+
+def test_partial_action_holds_missing_joints(robot):
+    sent = robot.send_action({"shoulder_pan.pos": 0.0})
+
+    assert robot.robot.sent[-1][1:5] == pytest.approx([20.0, 30.0, 40.0, 50.0])
+    expected = robot._degs_to_norms(np.array(robot.robot.angles))
+    assert [sent[f"{j}.pos"] for j in ("shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll")] == (
+        pytest.approx(expected[1:5].tolist())
+    )
+
+
+def test_partial_action_without_gripper_reports_gripper_units(robot):
+    sent = robot.send_action({"shoulder_pan.pos": 0.0})
+
+    # The gripper holds its 45° reading and is reported in [0, 100] like
+    # get_observation(), not in joint-limit units
+    assert robot.robot.sent[-1][5] == pytest.approx(45.0)
+    assert sent["gripper.pos"] == pytest.approx(robot._gripper_deg_to_norm(45.0))
+    assert sent["gripper.pos"] == pytest.approx(50.0)
+
+
+def test_gripper_in_action_is_sent_in_joint_frame(robot):
+    sent = robot.send_action({"shoulder_pan.pos": 0.0, "gripper.pos": 100.0})
+
+    assert robot.robot.sent[-1][5] == pytest.approx(90.0)
+    assert sent["gripper.pos"] == pytest.approx(100.0)
+
+
+def test_background_read_failure_goes_stale(monkeypatch):
+    monkeypatch.setattr(roarm_module, "RoarmSDK", FakeSDK)
+    robot = Roarm(RoarmConfig(port="/dev/ttyUSB0", cameras={}, obs_poll_hz=200.0, low_latency=False))
+    robot.connect()
+    try:
+        assert robot.get_state().joint_pos[0] != 0.0
+
+        # The SDK's -1 failure value must not be published as an all-zero sample
+        robot.robot.angles = -1
+        time.sleep(0.15)
+        with pytest.raises(RuntimeError, match="ms old"):
+            robot.get_state()
+    finally:
+        robot.disconnect()
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("lerobot")
+pytest.importorskip("roarm_sdk")
+
+from lerobot_robot_roarm import RoarmTeleoperatorConfig, roarm_teleoperator
+from lerobot_robot_roarm.roarm_teleoperator import RoarmTeleoperator
+
+
+class FakeSDK:
+    """Reports fixed angles (SDK order, degrees), or -1 like a failed SDK read."""
+
+    def __init__(self, **kwargs):
+        self.angles = [10.0, 20.0, 30.0, 40.0, 50.0, 45.0]
+
+    def joints_angle_get(self):
+        return list(self.angles) if self.angles != -1 else -1
+
+    def torque_set(self, cmd):
+        pass
+
+
+@pytest.fixture
+def leader(monkeypatch):
+    monkeypatch.setattr(roarm_teleoperator, "RoarmSDK", FakeSDK)
+    config = RoarmTeleoperatorConfig(port="/dev/ttyUSB0", low_latency=False, angle_cache_ttl_s=60.0)
+    leader = RoarmTeleoperator(config)
+    leader.connect()
+    yield leader
+    leader.disconnect()
+
+
+def test_failed_read_is_not_cached(leader):
+    leader.roarm.angles = -1
+    with pytest.raises(RuntimeError, match="Failed to read"):
+        leader.get_action()
+    assert leader._angle_cache is None
+
+    leader.roarm.angles = [0.0] * 6
+    assert leader.get_action()["shoulder_pan.pos"] == pytest.approx(0.0)
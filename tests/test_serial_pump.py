@@ -0,0 +1,159 @@
+import logging
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("lerobot")
+pytest.importorskip("roarm_sdk")
+
+from lerobot_robot_roarm import RoarmTeleoperatorConfig, roarm_teleoperator
+from lerobot_robot_roarm._serial_pump import RoarmWriter, SerialPump
+from lerobot_robot_roarm.roarm_teleoperator import RoarmTeleoperator
+
+
+class FakeSDK:
+    """Counts reads; joint angles advance by one degree per read."""
+
+    def __init__(self, **kwargs):
+        self.reads = 0
+        self.fail = False
+
+    def joints_angle_get(self):
+        if self.fail:
+            raise OSError("unplugged")
+        self.reads += 1
+        return [float(self.reads)] * 6
+
+    def torque_set(self, cmd):
+        pass
+
+
+def wait_for(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def test_pump_publishes_latest_sample():
+    sdk = FakeSDK()
+    pump = SerialPump(sdk, poll_hz=1000.0)
+    pump.start()
+    assert pump.joints is not None
+    wait_for(lambda: sdk.reads >= 10)
+    pump.stop()
+
+    assert pump.joints == (float(sdk.reads),) * 6
+
+
+def test_pump_stop_ends_polling():
+    sdk = FakeSDK()
+    pump = SerialPump(sdk, poll_hz=1000.0)
+    pump.start()
+    pump.stop()
+
+    assert not pump.is_running
+    reads = sdk.reads
+    time.sleep(0.02)
+    assert sdk.reads == reads
+
+
+def test_pump_warns_once_per_outage(caplog):
+    sdk = FakeSDK()
+    pump = SerialPump(sdk, poll_hz=1000.0)
+    pump.start()
+    try:
+        with caplog.at_level(logging.INFO, logger="lerobot_robot_roarm._serial_pump"):
+            sdk.fail = True
+            time.sleep(0.03)
+            sdk.fail = False
+            reads = sdk.reads
+            wait_for(lambda: sdk.reads > reads + 1)
+    finally:
+        pump.stop()
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert any("recovered" in r.getMessage() for r in caplog.records)
+
+
+@pytest.fixture
+def leader(monkeypatch):
+    monkeypatch.setattr(roarm_teleoperator, "RoarmSDK", FakeSDK)
+    config = RoarmTeleoperatorConfig(port="/dev/ttyUSB0", low_latency=False, pump_hz=500.0)
+    leader = RoarmTeleoperator(config)
+    leader.connect()
+    yield leader
+    leader.disconnect()
+
+
+def test_stale_pump_sample_raises(leader):
+    assert leader.get_action()
+
+    leader.roarm.fail = True
+    time.sleep(0.15)  # past the 100 ms floor on the staleness limit
+    with pytest.raises(RuntimeError, match="not answering"):
+        leader.get_action()
+
+    leader.roarm.fail = False
+    wait_for(lambda: time.monotonic() - leader._pump.stamp < 0.005)
+    assert leader.get_action()
+
+
+def test_late_pump_sample_is_accepted(leader):
+    # Past 5 periods at 500 Hz, but within the 100 ms floor: USB jitter, not an outage
+    leader.roarm.fail = True
+    time.sleep(0.03)
+    try:
+        assert leader.get_action()
+    finally:
+        leader.roarm.fail = False
+
+
+class BlockingSDK:
+    """pose_ctrl blocks until released, so posts pile up behind the first."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.fail_on = None
+
+    def pose_ctrl(self, pose):
+        self.started.set()
+        self.release.wait()
+        if pose == self.fail_on:
+            raise OSError("write failed")
+        self.sent.append(pose)
+
+
+def test_writer_keeps_only_newest_pending_value():
+    sdk = BlockingSDK()
+    writer = RoarmWriter(sdk)
+    writer.start()
+
+    writer.post(1)
+    sdk.started.wait(1.0)
+    for value in (2, 3, 4):
+        writer.post(value)
+    sdk.release.set()
+    writer.close()
+
+    assert sdk.sent == [1, 4]
+
+
+def test_writer_survives_command_errors():
+    sdk = BlockingSDK()
+    sdk.release.set()
+    sdk.fail_on = 1
+    writer = RoarmWriter(sdk)
+    writer.start()
+
+    writer.post(1)
+    writer._slot.join()
+    writer.post(2)
+    writer.close()
+
+    assert sdk.sent == [2]
@@ -0,0 +1,134 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("lerobot")
+pytest.importorskip("roarm_sdk")
+
+if not sys.platform.startswith("linux"):
+    pytest.skip("low-latency mode is Linux only", allow_module_level=True)
+
+import fcntl
+import termios
+
+from lerobot_robot_roarm import serial_utils
+from lerobot_robot_roarm.serial_utils import ASYNC_LOW_LATENCY, enable_low_latency, sdk_fileno
+
+
+class FakeTTY:
+    """Stands in for TIOCGSERIAL/TIOCSSERIAL on a serial_struct."""
+
+    def __init__(self, flags=0, error=None):
+        self.flags = flags
+        self.error = error
+        self.fds = []
+
+    def ioctl(self, fd, request, buf):
+        self.fds.append(fd)
+        if self.error is not None:
+            raise self.error
+        idx = serial_utils._SERIAL_STRUCT_FLAGS_IDX
+        if request == termios.TIOCGSERIAL:
+            buf[idx] = self.flags
+        elif request == termios.TIOCSSERIAL:
+            self.flags = buf[idx]
+        return 0
+
+
+@pytest.fixture
+def port(tmp_path, monkeypatch):
+    """A fake /dev/ttyUSB0 plus its usb-serial sysfs attributes."""
+    dev = tmp_path / "ttyUSB0"
+    dev.touch()
+    attrs = tmp_path / "sysfs" / "ttyUSB0"
+    attrs.mkdir(parents=True)
+    (attrs / "latency_timer").write_text("16")
+    (attrs / "event_char").write_text("0")
+    monkeypatch.setattr(serial_utils, "_USB_SERIAL_SYSFS", str(tmp_path / "sysfs"))
+    return dev, attrs
+
+
+class FakeSerial:
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        if self.fd is None:
+            raise OSError("Port not open")
+        return self.fd
+
+
+class FakeSDK:
+    def __init__(self, fd=None):
+        self._serial_port = FakeSerial(fd)
+
+
+def test_sets_flag_latency_timer_and_event_char(port, monkeypatch):
+    dev, attrs = port
+    tty = FakeTTY(flags=0x40)
+    monkeypatch.setattr(fcntl, "ioctl", tty.ioctl)
+
+    assert enable_low_latency(str(dev), latency_ms=2, event_char=ord("\n"), fd=7)
+
+    assert tty.fds == [7, 7]
+    assert tty.flags == 0x40 | ASYNC_LOW_LATENCY
+    assert (attrs / "latency_timer").read_text() == "2"
+    assert (attrs / "event_char").read_text() == str(0x100 | ord("\n"))
+
+
+def test_event_char_left_alone_by_default(port, monkeypatch):
+    dev, attrs = port
+    monkeypatch.setattr(fcntl, "ioctl", FakeTTY().ioctl)
+
+    enable_low_latency(str(dev))
+
+    assert (attrs / "event_char").read_text() == "0"
+
+
+def test_ioctl_failure_is_logged_not_raised(port, monkeypatch, caplog):
+    dev, attrs = port
+    monkeypatch.setattr(fcntl, "ioctl", FakeTTY(error=OSError("not a serial port")).ioctl)
+
+    assert enable_low_latency(str(dev), fd=7)
+
+    assert "ASYNC_LOW_LATENCY" in caplog.text
+    assert (attrs / "latency_timer").read_text() == "1"
+
+
+def test_adapter_without_sysfs_attributes(port, monkeypatch):
+    dev, attrs = port
+    for attr in attrs.iterdir():
+        attr.unlink()
+    monkeypatch.setattr(fcntl, "ioctl", FakeTTY(error=OSError("not a serial port")).ioctl)
+
+    assert not enable_low_latency(str(dev), event_char=ord("\n"), fd=7)
+
+
+def test_noop_off_linux(port, monkeypatch):
+    dev, attrs = port
+    monkeypatch.setattr(serial_utils.sys, "platform", "darwin")
+
+    assert not enable_low_latency(str(dev))
+    assert (attrs / "latency_timer").read_text() == "16"
+
+
+def test_never_opens_the_device_node(port, monkeypatch):
+    # Opening the tty raises DTR/RTS and can reset the ESP32
+    dev, attrs = port
+    tty = FakeTTY()
+    monkeypatch.setattr(fcntl, "ioctl", tty.ioctl)
+    opened = []
+    monkeypatch.setattr(os, "open", lambda *args, **kwargs: opened.append(args))
+
+    assert enable_low_latency(str(dev))
+
+    assert opened == []
+    assert tty.fds == []
+    assert (attrs / "latency_timer").read_text() == "1"
+
+
+def test_sdk_fileno():
+    assert sdk_fileno(FakeSDK(fd=5)) == 5
+    assert sdk_fileno(FakeSDK(fd=None)) is None
+    assert sdk_fileno(object()) is None
@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+pytest.importorskip("lerobot")
+pytest.importorskip("roarm_sdk")
+
+from lerobot_robot_roarm import timing
+from lerobot_robot_roarm.timing import sleep_until
+
+# Generous upper bound on oversleep so loaded CI machines don't flake
+SLACK_NS = 50_000_000
+
+
+@pytest.fixture(params=["native", "fallback"])
+def sleeper(request, monkeypatch):
+    if request.param == "native" and timing._clock_nanosleep is None:
+        pytest.skip("clock_nanosleep not available")
+    if request.param == "fallback":
+        monkeypatch.setattr(timing, "_clock_nanosleep", None)
+    return sleep_until
+
+
+def test_sleeps_until_deadline(sleeper):
+    deadline = time.monotonic_ns() + 20_000_000
+    sleeper(deadline)
+    woke = time.monotonic_ns()
+
+    assert woke >= deadline
+    assert woke - deadline < SLACK_NS
+
+
+def test_past_deadline_returns_immediately(sleeper):
+    start = time.monotonic_ns()
+    sleeper(start - 1_000_000_000)
+
+    assert time.monotonic_ns() - start < SLACK_NS
+